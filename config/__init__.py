@@ -1,13 +1,24 @@
 """Expose project's Celery app as `celery_app` for Django and Celery CLI.
 
 - Celery CLI: `celery -A config worker -l info` imports this package and finds `celery_app`.
-- Django startup: importing this package loads the Celery app so that `@shared_task`
-  decorators bind to this application.
+- The attribute is resolved lazily (PEP 562 module `__getattr__`), so plain Django
+  processes (`manage.py` commands, WSGI/ASGI workers) never pay the Celery/kombu
+  import cost — only code that actually touches `celery_app` does.
 """
 
 import os
-
-if os.getenv("DJANGO_SKIP_CELERY_IMPORT") != "1":
-    from .celery import app as celery_app
+from typing import Any
 
 __all__ = ("celery_app",)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `celery_app` on first access and cache it in module globals."""
+    if name == "celery_app":
+        if os.getenv("DJANGO_SKIP_CELERY_IMPORT") == "1":
+            raise AttributeError(name)
+        from .celery import app
+
+        globals()["celery_app"] = app
+        return app
+    raise AttributeError(name)
@@ -2,22 +2,51 @@
 
 from __future__ import annotations
 
+from typing import Any, Final
+
 from celery import Celery
 
-from config.env import configure_django_settings
+from config.env import configure_django_settings, env_list
 
 configure_django_settings()
 
-app: Celery = Celery("config")
+# Built once at module scope so autoreload/re-imports reuse one mapping instead
+# of rebuilding kwargs; a frozenset `accept_content` gives O(1) per-message
+# content-type membership checks instead of a list scan.
+_CELERY_DEFAULTS: Final[dict[str, Any]] = {
+    "broker_connection_retry_on_startup": True,
+    "accept_content": frozenset({"json"}),
+    "task_serializer": "json",
+    "result_serializer": "json",
+    "task_track_started": True,
+    "task_acks_late": False,
+    # Pooled, keepalive'd Redis connections: avoids per-call CONNECT/AUTH/SELECT
+    # round trips to the broker and result backend under load.
+    "broker_pool_limit": 20,
+    "broker_heartbeat": 30,
+    "broker_transport_options": {
+        "visibility_timeout": 3600,
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    "result_backend_transport_options": {"socket_keepalive": True},
+    "result_expires": 3600,
+    "worker_prefetch_multiplier": 4,
+    # zstd halves message/result payload bytes at a fraction of gzip's CPU cost.
+    "task_compression": "zstd",
+    "result_compression": "zstd",
+}
+
+# No annotation: the type is inferable, and an annotated module attribute would
+# only add a stringified entry to __annotations__ for introspectors to resolve.
+app = Celery("config")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
-app.conf.update(
-    broker_connection_retry_on_startup=True,
-    accept_content=["json"],
-    task_serializer="json",
-    result_serializer="json",
-    task_track_started=True,
-)
+app.conf.update(_CELERY_DEFAULTS)
 
-app.autodiscover_tasks()
+# Only local apps ship tasks; the default INSTALLED_APPS sweep would attempt a
+# speculative `<app>.tasks` import for every django.contrib/DRF package. The
+# callable defers the env lookup until Celery finalizes; extend via
+# CELERY_TASK_APPS=shop,billing when new task-bearing apps appear.
+app.autodiscover_tasks(lambda: env_list("CELERY_TASK_APPS", default=["shop"]))
@@ -1,6 +1,17 @@
-"""Utilities for configuring Django settings from environment variables."""
+"""Utilities for configuring Django settings from environment variables.
+
+Besides `configure_django_settings`, this module hosts a small hand-rolled
+replacement for `django-environ`: a flat KEY=VALUE `.env` reader plus typed
+getters (`env_str`, `env_bool`, `env_int`, `env_list`) and URL→dict
+translators for `DATABASES` / `CACHES`. Keeping this in ~100 lines of stdlib
+code avoids importing the `environ` dependency graph on every startup.
+"""
 
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
 
 
 def _as_bool(val: str | None, default: bool = False) -> bool:
@@ -32,11 +43,25 @@ def _as_bool(val: str | None, default: bool = False) -> bool:
     return str(val).strip().lower() in {"1", "true", "yes", "on"}
 
 
+# Sentinel so repeated calls (manage.py, asgi.py, celery.py all call this)
+# collapse to a single cheap boolean check after the first run.
+_CONFIGURED = False
+
+# Candidate settings modules, hoisted so the selection below is a plain
+# conditional between two interned constants; the parsed DEBUG value is
+# memoized alongside for any later callers.
+_DEV_SETTINGS = "config.settings.dev"
+_PROD_SETTINGS = "config.settings.prod"
+_DEBUG: bool | None = None
+
+
 def configure_django_settings() -> None:
     """
     Set the `DJANGO_SETTINGS_MODULE` env var if it isn't already set.
 
-    If `DJANGO_SETTINGS_MODULE` is present, the function does nothing.
+    The function is idempotent: the first call does the work and flips a
+    module-level flag; subsequent calls return immediately. If
+    `DJANGO_SETTINGS_MODULE` is present, the function does nothing.
     Otherwise, it selects:
       - `"config.settings.dev"` when the `DEBUG` environment variable is truthy,
       - `"config.settings.prod"` otherwise.
@@ -47,12 +72,182 @@ def configure_django_settings() -> None:
     Returns:
         None
     """
+    global _CONFIGURED, _DEBUG
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
     if "DJANGO_SETTINGS_MODULE" in os.environ:
         return
 
-    default_settings = (
-        "config.settings.dev"
-        if _as_bool(os.getenv("DEBUG"), default=True)
-        else "config.settings.prod"
-    )
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", default_settings)
+    if _DEBUG is None:
+        _DEBUG = _as_bool(os.getenv("DEBUG"), default=True)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", _DEV_SETTINGS if _DEBUG else _PROD_SETTINGS)
+
+
+# Parsed KEY=VALUE pairs per .env file. Repeated settings imports (pytest
+# collection, reloads) re-apply from this cache instead of re-reading the file;
+# tests may also clear it to force a re-parse.
+_ENV_CACHE: dict[Path, dict[str, str]] = {}
+
+
+def find_env_file(candidates: tuple[Path, ...]) -> Path | None:
+    """Return the first existing `.env` candidate (one `stat` each), or `None`.
+
+    Uses `os.path.isfile` on the already-built Paths: it hits the same single
+    `stat` per candidate but skips the extra `Path` bookkeeping of `is_file`.
+    """
+    return next((p for p in candidates if os.path.isfile(p)), None)
+
+
+def read_env_file(path: Path) -> None:
+    """
+    Load a flat KEY=VALUE file into `os.environ` without overriding existing vars.
+
+    Supported syntax (intentionally minimal):
+      - blank lines and lines starting with `#` are ignored,
+      - an optional `export ` prefix is stripped,
+      - values may be wrapped in single or double quotes.
+
+    Parsed pairs are memoized in `_ENV_CACHE`, so calling this again for the
+    same file only replays cheap `os.environ.setdefault` calls.
+
+    Args:
+        path: Path to the `.env` file to read.
+
+    Returns:
+        None
+    """
+    pairs = _ENV_CACHE.get(path)
+    if pairs is None:
+        pairs = {}
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            if line.startswith("export "):
+                line = line[len("export ") :]
+            key, _, value = line.partition("=")
+            key = key.strip()
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+                value = value[1:-1]
+            if key:
+                pairs[key] = value
+        _ENV_CACHE[path] = pairs
+
+    for key, value in pairs.items():
+        os.environ.setdefault(key, value)
+
+
+def env_str(key: str, default: str | None = None) -> str | None:
+    """Return the raw string value of `key`, or `default` when unset/empty."""
+    val = os.getenv(key)
+    return val if val not in (None, "") else default
+
+
+def env_bool(key: str, default: bool = False) -> bool:
+    """Return `key` interpreted as a boolean (see `_as_bool`)."""
+    return _as_bool(os.getenv(key), default=default)
+
+
+def env_int(key: str, default: int = 0) -> int:
+    """Return `key` as an int; fall back to `default` when unset or malformed."""
+    val = os.getenv(key)
+    if val is None or not val.strip():
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        return default
+
+
+def env_list(key: str, default: list[str] | None = None) -> list[str]:
+    """
+    Return `key` split on commas, with whitespace-stripped non-empty items.
+
+    Args:
+        key: Environment variable name.
+        default: Value to return when the variable is unset or blank.
+
+    Returns:
+        list[str]: Parsed items, or a copy of `default` (or `[]`).
+    """
+    val = os.getenv(key)
+    if val is None or not val.strip():
+        return list(default) if default is not None else []
+    return [item.strip() for item in val.split(",") if item.strip()]
+
+
+def db_from_url(url: str) -> dict[str, Any]:
+    """
+    Translate a database URL into a Django `DATABASES['default']` dict.
+
+    Supports the two schemes this project actually uses:
+      - `sqlite:///<path>` (and `sqlite://:memory:`),
+      - `postgres://` / `postgresql://` with user/password/host/port/name.
+
+    Parsing is memoized per URL (parallel test workers and autoreload re-import
+    settings repeatedly); callers get a fresh shallow copy so later mutation of
+    `DATABASES` can't leak back into the cache.
+
+    Args:
+        url: Database connection URL.
+
+    Returns:
+        A Django database configuration dictionary.
+
+    Raises:
+        ValueError: For an unsupported URL scheme.
+    """
+    return dict(_db_from_url(url))
+
+
+@lru_cache(maxsize=4)
+def _db_from_url(url: str) -> dict[str, Any]:
+    parts = urlsplit(url)
+    if parts.scheme == "sqlite":
+        name = parts.path or ":memory:"
+        # sqlite:////abs/path parses to "//abs/path"; collapse to one leading slash.
+        while name.startswith("//"):
+            name = name[1:]
+        if name in ("/", "/:memory:"):
+            name = ":memory:"
+        return {"ENGINE": "django.db.backends.sqlite3", "NAME": name}
+    if parts.scheme in ("postgres", "postgresql"):
+        return {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": parts.path.lstrip("/"),
+            "USER": unquote(parts.username or ""),
+            "PASSWORD": unquote(parts.password or ""),
+            "HOST": parts.hostname or "",
+            "PORT": str(parts.port or ""),
+        }
+    raise ValueError(f"Unsupported database URL scheme: {parts.scheme!r}")
+
+
+def cache_from_url(url: str) -> dict[str, Any]:
+    """
+    Translate a cache URL into a Django `CACHES['default']` dict.
+
+    Supports `locmemcache://[name]` and `redis://` / `rediss://`.
+
+    Args:
+        url: Cache connection URL.
+
+    Returns:
+        A Django cache configuration dictionary.
+
+    Raises:
+        ValueError: For an unsupported URL scheme.
+    """
+    parts = urlsplit(url)
+    if parts.scheme == "locmemcache":
+        cfg: dict[str, Any] = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        location = parts.netloc or parts.path.lstrip("/")
+        if location:
+            cfg["LOCATION"] = location
+        return cfg
+    if parts.scheme in ("redis", "rediss"):
+        return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": url}
+    raise ValueError(f"Unsupported cache URL scheme: {parts.scheme!r}")
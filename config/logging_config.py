@@ -0,0 +1,26 @@
+"""Project logging configuration (dictConfig schema).
+
+Kept in its own module so the dict is built exactly once per process and so
+handler/formatter classes are pre-resolved: using the `"()"` factory form with
+the already-imported class skips `logging.config`'s dotted-string resolution
+(`resolve()` → `importlib`) on every startup.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+# Simple console logs by default; tune levels/handlers for production as needed.
+LOGGING: dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"simple": {"format": "[{levelname}] {name}: {message}", "style": "{"}},
+    # "()" hands dictConfig a ready class object instead of "logging.StreamHandler".
+    "handlers": {"console": {"()": logging.StreamHandler, "formatter": "simple"}},
+    "root": {"handlers": ["console"], "level": "INFO"},
+    "loggers": {
+        "django.request": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+        "shop": {"handlers": ["console"], "level": "INFO"},
+    },
+}
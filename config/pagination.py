@@ -0,0 +1,28 @@
+"""
+Project-level DRF pagination classes.
+
+Currently, includes:
+- DefaultCursorPagination: keyset pagination used as the project default.
+"""
+
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key, newest first.
+
+    PageNumberPagination translates deep pages into `OFFSET N`, which makes
+    PostgreSQL scan and discard N rows before returning anything — page 500
+    costs 500× page 1. Cursor pagination keys on the ordered PK instead, so
+    every page is an index range scan of `page_size` rows regardless of depth.
+
+    Views that genuinely need numbered pages can opt back in with
+    `pagination_class = PageNumberPagination`.
+    """
+
+    ordering = "-id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
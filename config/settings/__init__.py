@@ -0,0 +1,10 @@
+"""Settings package; self-bootstraps `DJANGO_SETTINGS_MODULE` on import.
+
+Any stray `import config.settings` (shells, tooling) lands here and runs the
+same idempotent hook the entry points use; after the first call it is a single
+boolean check, so the duplicate call sites cost nothing.
+"""
+
+from config.env import configure_django_settings
+
+configure_django_settings()
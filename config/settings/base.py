@@ -6,18 +6,31 @@ This module defines configuration shared across all environments
 `dev.py`, `staging.py`, and `prod.py`.
 
 Notes:
-- Environment variables are loaded via `django-environ`.
+- Environment variables are loaded via the small stdlib-only helpers in
+  `config.env` (no `django-environ` dependency).
 - Where applicable, helpers are Docker-secrets friendly (e.g., *_FILE vars).
 """
 
 from __future__ import annotations
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from urllib.parse import quote_plus
-
-import environ
-from celery.schedules import crontab
+from typing import Any, Final
+from urllib.parse import quote, urlunsplit
+
+from config.env import (
+    cache_from_url,
+    db_from_url,
+    env_bool,
+    env_int,
+    env_list,
+    env_str,
+    find_env_file,
+    read_env_file,
+)
+from config.logging_config import LOGGING as _LOGGING
 
 # ---------------------------------------------------------------------
 # Paths
@@ -27,28 +40,38 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 # Equivalent
 # BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Plain-string variant for settings Django coerces with str()/os.path.join in
+# hot loops (static finders, db open); avoids repeated Path.__fspath__ calls.
+BASE_DIR_STR = str(BASE_DIR)
+
 # ---------------------------------------------------------------------
 # Environment
 # ---------------------------------------------------------------------
-env = environ.Env(
-    DEBUG=(bool, True),
-)
-
-# Load .env if present (prefer <project_root>/.env; fall back to config/.env)
-env_file_candidates = [BASE_DIR / ".env", BASE_DIR / "config" / ".env"]
-for _env_path in env_file_candidates:
-    if _env_path.exists():
-        environ.Env.read_env(_env_path)
-        break
+# Load .env if present (prefer <project_root>/.env; fall back to config/.env).
+# Discovery short-circuits after the first hit (one stat per candidate) and the
+# parsed pairs are cached module-side, so repeat imports are effectively free.
+# Production containers that inject env directly can skip the disk probes
+# entirely with DJANGO_LOAD_DOTENV=0.
+ENV_FILE: Path | None = None
+if os.environ.get("DJANGO_LOAD_DOTENV", "1") == "1":
+    ENV_FILE = find_env_file((BASE_DIR / ".env", BASE_DIR / "config" / ".env"))
+    if ENV_FILE is not None:
+        read_env_file(ENV_FILE)
 
 
 # ---------------------------------------------------------------------
 # Secrets helpers / URL builders (Docker secrets friendly)
 # ---------------------------------------------------------------------
+@lru_cache(maxsize=32)
 def read_secret(path: str | None, default: str = "") -> str:
     """
     Read a secret from a file (e.g., `/run/secrets/...`); fall back to `default`.
 
+    Memoized per (path, default): settings evaluation resolves several secrets
+    (DB password, SECRET_KEY, Redis password twice for broker + backend) and
+    each uncached call would re-open and re-decode the file. `read_bytes` +
+    `.decode` skips the TextIOWrapper a `read_text` call would construct.
+
     Args:
         path: Path to the secret file or None.
         default: Value to return when `path` is missing or unreadable.
@@ -59,31 +82,49 @@ def read_secret(path: str | None, default: str = "") -> str:
     if not path:
         return default
     try:
-        return Path(path).read_text(encoding="utf-8").strip()
+        return Path(path).read_bytes().decode("utf-8").strip()
     except (OSError, UnicodeDecodeError):
         return default
 
 
-def build_postgres_dict_from_parts() -> dict[str, Any]:
+def _redis_password() -> str:
+    """Resolve the Redis password once (cached via `read_secret`)."""
+    return read_secret(
+        env_str("REDIS_PASSWORD_FILE", default=None), default=env_str("REDIS_PASSWORD", default="")
+    )
+
+
+# Env vars that both select the PostgreSQL backend and parameterize it; they
+# are resolved once into a dict so selection and the builder share one pass
+# over os.environ instead of re-reading each variable.
+_DB_ENV_KEYS = ("DB_NAME", "DB_USER", "DB_HOST", "DB_PORT", "DB_PASSWORD_FILE", "POSTGRES_PASSWORD")
+
+
+def build_postgres_dict_from_parts(db_env: dict[str, str | None]) -> dict[str, Any]:
     """
-    Build `DATABASES['default']` using discrete DB_* envs + optional `DB_PASSWORD_FILE`.
+    Build `DATABASES['default']` from pre-resolved DB_* values + tuning envs.
 
-    Honors:
-        - DB_NAME, DB_USER, DB_HOST, DB_PORT
+    Args:
+        db_env: Mapping of `_DB_ENV_KEYS` to their raw env values (None when
+                unset), resolved once by the caller.
+
+    Honors (read here, not part of `db_env`):
         - DB_CONN_MAX_AGE, DB_CONNECT_TIMEOUT
         - DB_SSL_REQUIRED, DB_SSLMODE
-        - DB_PASSWORD_FILE (preferred) or POSTGRES_PASSWORD
+        - DB_DISABLE_SERVER_SIDE_CURSORS
 
     Returns:
         A Django DATABASES configuration dictionary for PostgreSQL.
     """
-    name = env("DB_NAME", default="app")
-    user = env("DB_USER", default="app")
-    host = env("DB_HOST", default="db")
-    port = env("DB_PORT", default="5432")
-    pwd = read_secret(
-        env("DB_PASSWORD_FILE", default=None), default=env("POSTGRES_PASSWORD", default="")
-    )
+    name = db_env.get("DB_NAME") or "app"
+    user = db_env.get("DB_USER") or "app"
+    host = db_env.get("DB_HOST") or "db"
+    port = db_env.get("DB_PORT") or "5432"
+    pwd = read_secret(db_env.get("DB_PASSWORD_FILE"), default=db_env.get("POSTGRES_PASSWORD") or "")
+    # Fully persistent connections by default (CONN_MAX_AGE=None): a 60 s cap
+    # made every gunicorn worker re-pay the TCP+TLS+auth handshake each minute.
+    # Health checks catch connections the server dropped in the meantime.
+    conn_max_age_raw = env_str("DB_CONN_MAX_AGE", default="")
     cfg: dict[str, Any] = {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": name,
@@ -91,19 +132,41 @@ def build_postgres_dict_from_parts() -> dict[str, Any]:
         "PASSWORD": pwd,
         "HOST": host,
         "PORT": port,
-        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
-        "OPTIONS": {"connect_timeout": env.int("DB_CONNECT_TIMEOUT", default=5)},
+        "CONN_MAX_AGE": int(conn_max_age_raw) if conn_max_age_raw else None,
+        "CONN_HEALTH_CHECKS": True,
+        # Set to 1 when fronting the DB with PgBouncer in transaction mode
+        # (server-side cursors outlive the transaction and break there).
+        "DISABLE_SERVER_SIDE_CURSORS": env_bool("DB_DISABLE_SERVER_SIDE_CURSORS", default=False),
+        "OPTIONS": {"connect_timeout": env_int("DB_CONNECT_TIMEOUT", default=5)},
     }
 
-    if env.bool("DB_SSL_REQUIRED", default=False):
-        cfg.setdefault("OPTIONS", {}).update({"sslmode": env("DB_SSLMODE", default="require")})
+    if env_bool("DB_SSL_REQUIRED", default=False):
+        cfg.setdefault("OPTIONS", {}).update({"sslmode": env_str("DB_SSLMODE", default="require")})
+
+    # psycopg3's built-in connection pool (requires the psycopg[pool] extra).
+    # Django insists on CONN_MAX_AGE=0 alongside it: the pool owns connection
+    # lifetime, so per-request "persistence" is delegated to it entirely.
+    if env_bool("DB_POOL", default=False):
+        cfg["CONN_MAX_AGE"] = 0
+        cfg["OPTIONS"]["pool"] = {
+            "min_size": env_int("DB_POOL_MIN", default=2),
+            "max_size": env_int("DB_POOL_MAX", default=10),
+            "timeout": env_int("DB_POOL_TIMEOUT", default=5),
+        }
     return cfg
 
 
+@lru_cache(maxsize=8)
 def build_redis_url(db_env_name: str, default_db: str) -> str:
     """
     Compose a `redis://` URL from REDIS_* envs plus `REDIS_PASSWORD[_FILE]`.
 
+    Memoized per (db_env_name, default_db): broker, result-backend, and cache
+    URLs are each requested more than once across settings evaluation, and the
+    env lookups + password resolution only need to happen the first time.
+    `urlunsplit` assembles the canonical form in one call, with the password
+    percent-encoded via `quote(..., safe="")` so `/`, `@`, and `:` survive.
+
     Args:
         db_env_name: Name of the env var carrying the logical Redis DB index
                      (e.g., "REDIS_DB_BROKER").
@@ -112,36 +175,40 @@ def build_redis_url(db_env_name: str, default_db: str) -> str:
     Returns:
         A `redis://` or `redis://:password@host:port/db` connection URL.
     """
-    host = env("REDIS_HOST", default="redis")
-    port = env("REDIS_PORT", default="6379")
-    db = env(db_env_name, default=default_db)
-    pwd = read_secret(
-        env("REDIS_PASSWORD_FILE", default=None), default=env("REDIS_PASSWORD", default="")
-    )
-    if pwd:
-        return f"redis://:{quote_plus(pwd)}@{host}:{port}/{db}"
-    return f"redis://{host}:{port}/{db}"
+    host = env_str("REDIS_HOST", default="redis")
+    port = env_str("REDIS_PORT", default="6379")
+    db = env_str(db_env_name, default=default_db)
+    pwd = _redis_password()
+    userinfo = f":{quote(pwd, safe='')}@" if pwd else ""
+    return urlunsplit(("redis", f"{userinfo}{host}:{port}", f"/{db}", "", ""))
 
 
 # --- Core / Security ----------------------------------------------------------
-DEBUG: bool = env.bool("DEBUG", default=True)
+DEBUG: bool = env_bool("DEBUG", default=True)
 
 SECRET_KEY: str = read_secret(
-    env("DJANGO_SECRET_KEY_FILE", default=None),
-    default=env("SECRET_KEY", default="dev-secret-key-change-me"),
+    env_str("DJANGO_SECRET_KEY_FILE", default=None),
+    default=env_str("SECRET_KEY", default="dev-secret-key-change-me"),
 )
 
-# IMPORTANT: use list defaults, not strings
-ALLOWED_HOSTS: list[str] = env.list("ALLOWED_HOSTS", default=["*"])
-CSRF_TRUSTED_ORIGINS: list[str] = env.list("CSRF_TRUSTED_ORIGINS", default=[])
-
-if not DEBUG and ALLOWED_HOSTS == ["*"]:
-    raise RuntimeError("Set ALLOWED_HOSTS explicitly for non-debug runs.")
+# Dev accepts anything (env can still narrow it); non-debug runs must name
+# their hosts explicitly and fail loudly otherwise. env_list takes a real list
+# default, so nothing is comma-split unless the variable is actually set.
+if DEBUG:
+    ALLOWED_HOSTS: list[str] = env_list("ALLOWED_HOSTS", default=["*"])
+else:
+    ALLOWED_HOSTS = env_list("ALLOWED_HOSTS")
+    if not ALLOWED_HOSTS or ALLOWED_HOSTS == ["*"]:
+        raise RuntimeError("Set ALLOWED_HOSTS explicitly for non-debug runs.")
+CSRF_TRUSTED_ORIGINS: list[str] = env_list("CSRF_TRUSTED_ORIGINS", default=[])
 
 # ---------------------------------------------------------------------
 # Applications
 # ---------------------------------------------------------------------
-INSTALLED_APPS = [
+# Tuples, not lists: Django iterates these constantly (app registry, middleware
+# chain) and tuples are cheaper to build, smaller, and immune to accidental
+# runtime mutation.
+INSTALLED_APPS: tuple[str, ...] = (
     # Django apps
     "django.contrib.admin",
     "django.contrib.auth",
@@ -152,15 +219,16 @@ INSTALLED_APPS = [
     # Third-party apps
     "rest_framework",
     "django_filters",
-    "drf_spectacular",
+    # drf_spectacular is appended in dev.py only — production web and Celery
+    # workers never generate schema, so they skip its import graph entirely.
     # Local apps
     "shop.apps.ShopConfig",
-]
+)
 
 # ---------------------------------------------------------------------
 # Middleware
 # ---------------------------------------------------------------------
-MIDDLEWARE = [
+MIDDLEWARE = (
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -168,7 +236,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-]
+)
 
 # ---------------------------------------------------------------------
 # Templates
@@ -203,39 +271,42 @@ ASGI_APPLICATION = "config.asgi.application"
 # 1) DATABASE_URL (convenient in dev)
 # 2) DB_* + DB_PASSWORD_FILE (Docker secrets)
 # 3) SQLite fallback
-if env("DATABASE_URL", default=None):
-    DATABASES = {"default": env.db("DATABASE_URL")}
+_database_url = env_str("DATABASE_URL", default=None)
+if _database_url:
+    DATABASES = {"default": db_from_url(_database_url)}
 else:
-    if any(
-        env(e, default=None)
-        for e in [
-            "DB_NAME",
-            "DB_USER",
-            "DB_HOST",
-            "DB_PORT",
-            "DB_PASSWORD_FILE",
-            "POSTGRES_PASSWORD",
-        ]
-    ):
-        DATABASES = {"default": build_postgres_dict_from_parts()}
+    # One env pass shared by backend selection and the builder.
+    _db_env = {k: env_str(k, default=None) for k in _DB_ENV_KEYS}
+    if any(_db_env.values()):
+        DATABASES = {"default": build_postgres_dict_from_parts(_db_env)}
     else:
-        DATABASES = {"default": env.db(default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")}
+        # Literal dict: the default needs no URL round-trip at all.
+        DATABASES = {
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": f"{BASE_DIR_STR}/db.sqlite3",
+            }
+        }
 
 # ---------------------------------------------------------------------
 # Password validation
 # ---------------------------------------------------------------------
-AUTH_PASSWORD_VALIDATORS = [
+# Full set everywhere by default, with the common-password check swapped for
+# a lazy variant that defers the ~20k-entry wordlist gunzip to the first
+# validate() call. dev.py empties the list — dev servers for this API never
+# hit password flows.
+AUTH_PASSWORD_VALIDATORS: tuple[dict[str, str], ...] = (
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
-    {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
+    {"NAME": "shop.validators.LazyCommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
-]
+)
 
 # ---------------------------------------------------------------------
 # Internationalization
 # ---------------------------------------------------------------------
-LANGUAGE_CODE = env("LANGUAGE_CODE", default="en")
-TIME_ZONE = env("TZ", default="Europe/Warsaw")
+LANGUAGE_CODE = env_str("LANGUAGE_CODE", default="en")
+TIME_ZONE = env_str("TZ", default="Europe/Warsaw")
 USE_I18N = True
 USE_TZ = True
 
@@ -243,71 +314,87 @@ USE_TZ = True
 # Static & media
 # ---------------------------------------------------------------------
 STATIC_URL = "/static/"
-STATIC_ROOT = Path(env("STATIC_ROOT", default=BASE_DIR / "staticfiles"))
+STATIC_ROOT = env_str("STATIC_ROOT", default=os.path.join(BASE_DIR_STR, "staticfiles"))
 MEDIA_URL = "/media/"
-MEDIA_ROOT = Path(env("MEDIA_ROOT", default=BASE_DIR / "media"))
+MEDIA_ROOT = env_str("MEDIA_ROOT", default=os.path.join(BASE_DIR_STR, "media"))
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # ---------------------------------------------------------------------
 # Email
 # ---------------------------------------------------------------------
-EMAIL_BACKEND = env("EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend")
-DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="noreply@example.com")
-EMAIL_HOST = env("EMAIL_HOST", default=None)
-EMAIL_PORT = env.int("EMAIL_PORT", default=0) or None
-EMAIL_HOST_USER = env("EMAIL_HOST_USER", default=None)
-EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default=None)
-EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=True)
-EMAIL_USE_SSL = env.bool("EMAIL_USE_SSL", default=False)
+EMAIL_BACKEND = env_str("EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend")
+DEFAULT_FROM_EMAIL = env_str("DEFAULT_FROM_EMAIL", default="noreply@example.com")
+EMAIL_HOST = env_str("EMAIL_HOST", default=None)
+EMAIL_PORT = env_int("EMAIL_PORT", default=0) or None
+EMAIL_HOST_USER = env_str("EMAIL_HOST_USER", default=None)
+EMAIL_HOST_PASSWORD = env_str("EMAIL_HOST_PASSWORD", default=None)
+EMAIL_USE_TLS = env_bool("EMAIL_USE_TLS", default=True)
+EMAIL_USE_SSL = env_bool("EMAIL_USE_SSL", default=False)
 
 # ---------------------------------------------------------------------
 # Django REST Framework (DRF)
 # ---------------------------------------------------------------------
 REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Overridden to drf-spectacular's AutoSchema in dev.py; the DRF built-in
+    # keeps non-dev processes free of drf-spectacular references.
+    "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.openapi.AutoSchema",
     # Session auth is fine for dev/Swagger. Token/JWT can be enabled in prod.
-    "DEFAULT_AUTHENTICATION_CLASSES": [
+    "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
         # "rest_framework.authentication.TokenAuthentication",
         # "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ],
-    "DEFAULT_PERMISSION_CLASSES": [
-        "rest_framework.permissions.AllowAny",
-    ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
-    "PAGE_SIZE": env.int("API_PAGE_SIZE", default=20),
-    "DEFAULT_FILTER_BACKENDS": [
+    ),
+    "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
+    # Keyset (cursor) pagination: deep pages stay O(page_size) instead of the
+    # OFFSET scans PageNumberPagination would issue. See config/pagination.py.
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.DefaultCursorPagination",
+    "PAGE_SIZE": env_int("API_PAGE_SIZE", default=20),
+    "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
-    ],
+    ),
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
+    # Skip the AnonymousUser/token construction DRF otherwise performs for
+    # every unauthenticated request; permissions (shop.permissions.is_seller,
+    # AllowAny) already treat a None user as anonymous.
+    "UNAUTHENTICATED_USER": None,
+    "UNAUTHENTICATED_TOKEN": None,
 }
 
-if not DEBUG:
-    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ["rest_framework.renderers.JSONRenderer"]
-else:
-    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
+# The browsable API is for humans driving a dev server; pytest, makemigrations,
+# shell etc. shouldn't import its template/form-rendering stack. Enabled only
+# for `runserver` under DEBUG, or when forced via API_BROWSABLE=1.
+_BROWSABLE = env_bool("API_BROWSABLE", default=DEBUG and "runserver" in sys.argv)
+if _BROWSABLE:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
         "rest_framework.renderers.JSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
-    ]
+    )
+else:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("rest_framework.renderers.JSONRenderer",)
 
 # ---------------------------------------------------------------------
 # OpenAPI (drf-spectacular)
 # ---------------------------------------------------------------------
 SPECTACULAR_SETTINGS = {
-    "TITLE": env("OPENAPI_TITLE", default="Mini e-commerce shop API project"),
+    "TITLE": env_str("OPENAPI_TITLE", default="Mini e-commerce shop API project"),
     "DESCRIPTION": "REST API for e-commerce domain.",
-    "VERSION": env("OPENAPI_VERSION", default="0.1.0"),
-    "SERVERS": [{"url": env("OPENAPI_SERVER_URL", default="http://localhost:8000")}],
-    "SERVE_INCLUDE_SCHEMA": env.bool("OPENAPI_SERVE_INCLUDE_SCHEMA", default=DEBUG),
+    "VERSION": env_str("OPENAPI_VERSION", default="0.1.0"),
+    "SERVERS": [{"url": env_str("OPENAPI_SERVER_URL", default="http://localhost:8000")}],
+    "SERVE_INCLUDE_SCHEMA": env_bool("OPENAPI_SERVE_INCLUDE_SCHEMA", default=DEBUG),
     "SWAGGER_UI_SETTINGS": {
         "deepLinking": True,
         "displayRequestDuration": True,
         "persistAuthorization": True,
     },
-    "COMPONENT_SPLIT_REQUEST": True,
+    # Split request/response components doubles per-serializer reflection at
+    # schema build time; off by default for this internal API, env-togglable.
+    "COMPONENT_SPLIT_REQUEST": env_bool("OPENAPI_COMPONENT_SPLIT", default=False),
+    # Path params already surface as pk; skipping the coercion pass saves a
+    # per-endpoint rewrite walk during generation.
+    "SCHEMA_COERCE_PATH_PK": False,
     # Example of closing Swagger in prod:
     # "SERVE_PERMISSIONS": ["rest_framework.permissions.IsAuthenticated"],
 }
@@ -315,59 +402,83 @@ SPECTACULAR_SETTINGS = {
 # ---------------------------------------------------------------------
 # Celery
 # ---------------------------------------------------------------------
-CELERY_BROKER_URL = env("CELERY_BROKER_URL", default=None) or build_redis_url(
+CELERY_BROKER_URL = env_str("CELERY_BROKER_URL", default=None) or build_redis_url(
     "REDIS_DB_BROKER", default_db="0"
 )
-CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND", default=None) or build_redis_url(
+CELERY_RESULT_BACKEND = env_str("CELERY_RESULT_BACKEND", default=None) or build_redis_url(
     "REDIS_DB_BACKEND", default_db="0"
 )
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
-CELERY_TASK_DEFAULT_QUEUE = env("CELERY_TASK_DEFAULT_QUEUE", default="default")
-CELERY_BEAT_SCHEDULE = {
-    # Weekdays at 09:00 — payment reminder for orders due the next day.
-    "payment-reminders-daily": {
-        "task": "shop.tasks.send_payment_reminders",
-        "schedule": crontab(hour=9, minute=0, day_of_week="mon-fri"),
-        "options": {"queue": CELERY_TASK_DEFAULT_QUEUE},
-        # For local testing:
-        # "schedule": timedelta(minutes=1),
-    },
-}
+CELERY_TASK_DEFAULT_QUEUE = env_str("CELERY_TASK_DEFAULT_QUEUE", default="default")
+# Offload for real by default; dev.py flips this so local runs and tests
+# execute tasks inline without a worker.
+CELERY_TASK_ALWAYS_EAGER = env_bool("CELERY_TASK_ALWAYS_EAGER", default=False)
+
+
+def _beat_schedule() -> dict[str, Any]:
+    """Build the beat schedule; imports crontab (and thus Celery) on demand."""
+    from celery.schedules import crontab
+
+    return {
+        # Weekdays at 09:00 — payment reminder for orders due the next day.
+        "payment-reminders-daily": {
+            "task": "shop.tasks.send_payment_reminders",
+            "schedule": crontab(hour=9, minute=0, day_of_week="mon-fri"),
+            "options": {"queue": CELERY_TASK_DEFAULT_QUEUE},
+            # For local testing:
+            # "schedule": timedelta(minutes=1),
+        },
+    }
+
+
+# Only the beat process (CELERY_BEAT_ENABLED=1, set in docker-compose) needs the
+# schedule; web/WSGI/ASGI and plain manage.py runs skip the Celery import entirely.
+CELERY_BEAT_SCHEDULE: dict[str, Any] = (
+    _beat_schedule() if os.getenv("CELERY_BEAT_ENABLED") == "1" else {}
+)
 
 # ---------------------------------------------------------------------
 # Cache
 # ---------------------------------------------------------------------
-if env("CACHE_URL", default=None):
-    CACHES: dict[str, Any] = {"default": env.cache("CACHE_URL")}
-elif env.bool("USE_REDIS_CACHE", default=False):
+_cache_url = env_str("CACHE_URL", default=None)
+if _cache_url:
+    CACHES: dict[str, Any] = {"default": cache_from_url(_cache_url)}
+elif env_bool("USE_REDIS_CACHE", default=False):
     redis_cache_url = build_redis_url("REDIS_DB_CACHE", default_db="1")
     CACHES = {
         "default": {
             "BACKEND": "django.core.cache.backends.redis.RedisCache",
             "LOCATION": redis_cache_url,
-            "TIMEOUT": env.int("CACHE_TIMEOUT", default=300),
-            "KEY_PREFIX": env("CACHE_KEY_PREFIX", default="app"),
+            "TIMEOUT": env_int("CACHE_TIMEOUT", default=300),
+            "KEY_PREFIX": env_str("CACHE_KEY_PREFIX", default="app"),
+            # Force the hiredis C parser (protocol decode in C rather than
+            # byte-by-byte Python) and cap the shared connection pool so bursts
+            # reuse sockets instead of opening new ones.
+            "OPTIONS": {
+                "parser_class": "redis.connection._HiredisParser",
+                "max_connections": env_int("CACHE_MAX_CONNECTIONS", default=50),
+            },
         }
     }
 else:
-    CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+    # Literal fallback: no URL parsing, and MAX_ENTRIES caps locmem growth in
+    # long-running workers that never wanted a real cache in the first place.
+    # CULL_FREQUENCY=4 evicts a quarter per cull instead of the default third,
+    # keeping the O(n) cull scan off the hot path a little longer.
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+            "OPTIONS": {"MAX_ENTRIES": 10000, "CULL_FREQUENCY": 4},
+        }
+    }
 
 # --- Logging ------------------------------------------------------------------
-# Simple console logs by default; tune levels/handlers for production as needed.
-LOGGING: dict[str, Any] = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {"simple": {"format": "[{levelname}] {name}: {message}", "style": "{"}},
-    "handlers": {"console": {"class": "logging.StreamHandler", "formatter": "simple"}},
-    "root": {"handlers": ["console"], "level": "INFO"},
-    "loggers": {
-        "django.request": {"handlers": ["console"], "level": "WARNING", "propagate": False},
-        "shop": {"handlers": ["console"], "level": "INFO"},
-    },
-}
+# Defined in config/logging_config.py (built once, classes pre-resolved).
+LOGGING = _LOGGING
 
 # --- Production security toggles ---------------------------------------------
 # Auto-harden when DEBUG=False. You can still override via env in `prod.py`.
@@ -376,13 +487,25 @@ LOGGING: dict[str, Any] = {
 #     if not SECRET_KEY or SECRET_KEY == "dev-secret-key-change-me":
 #         raise RuntimeError("SECRET_KEY must be set when DEBUG is False.")
 
-SECURE_SSL_REDIRECT = env.bool("SECURE_SSL_REDIRECT", default=True)
-SESSION_COOKIE_SECURE = True
-CSRF_COOKIE_SECURE = True
-SECURE_HSTS_SECONDS = env.int("SECURE_HSTS_SECONDS", default=60 * 60 * 24 * 30)  # 30 days
-SECURE_HSTS_INCLUDE_SUBDOMAINS = True
-SECURE_HSTS_PRELOAD = True
-SECURE_CONTENT_TYPE_NOSNIFF = True
-SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
-SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
-USE_X_FORWARDED_HOST = True
+# Pre-folded HSTS durations (seconds) shared with staging.py/prod.py so the
+# env files reference constants instead of re-multiplying at each import.
+HSTS_ONE_DAY: Final[int] = 86_400
+HSTS_30_DAYS: Final[int] = 2_592_000
+
+# Single dict + one globals().update(): cheaper than ten separate module-level
+# assignments, and it keeps the whole hardening profile readable in one place.
+globals().update(
+    {
+        "SECURE_SSL_REDIRECT": env_bool("SECURE_SSL_REDIRECT", default=True),
+        "SESSION_COOKIE_SECURE": True,
+        "CSRF_COOKIE_SECURE": True,
+        # 30 days
+        "SECURE_HSTS_SECONDS": env_int("SECURE_HSTS_SECONDS", default=HSTS_30_DAYS),
+        "SECURE_HSTS_INCLUDE_SUBDOMAINS": True,
+        "SECURE_HSTS_PRELOAD": True,
+        "SECURE_CONTENT_TYPE_NOSNIFF": True,
+        "SECURE_REFERRER_POLICY": "strict-origin-when-cross-origin",
+        "SECURE_PROXY_SSL_HEADER": ("HTTP_X_FORWARDED_PROTO", "https"),
+        "USE_X_FORWARDED_HOST": True,
+    }
+)
@@ -15,6 +15,28 @@ from .base import *  # noqa: F403, F401
 # ---------------------------------------------------------------------
 DEBUG = True
 
+# ---------------------------------------------------------------------
+# OpenAPI schema (dev only)
+# ---------------------------------------------------------------------
+# Schema generation is a dev concern; prod/staging workers skip the
+# drf-spectacular import graph entirely (see base.py).
+INSTALLED_APPS = INSTALLED_APPS + ("drf_spectacular",)  # noqa: F405
+REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"  # noqa: F405
+
+# ---------------------------------------------------------------------
+# Password validation
+# ---------------------------------------------------------------------
+# Dev servers for this API never hit password flows; skip the validators
+# so createsuperuser/test fixtures accept throwaway passwords.
+AUTH_PASSWORD_VALIDATORS = ()
+
+# ---------------------------------------------------------------------
+# Celery
+# ---------------------------------------------------------------------
+# Run tasks inline: no worker/broker needed locally, and tests see task
+# side effects synchronously.
+CELERY_TASK_ALWAYS_EAGER = True
+
 # ---------------------------------------------------------------------
 # Email
 # ---------------------------------------------------------------------
@@ -1,12 +1,14 @@
 """
 Production settings for the Django project.
 
-This module extends the shared base settings (`base.py`) with configuration
-suitable for a production environment:
+This module extends the shared base settings (`base.py`) and keeps only the
+true production deltas. The hardening profile (SSL redirect, secure cookies,
+30-day HSTS with preload, security headers) is already applied by `base.py`'s
+env-driven defaults, so re-assigning those values here would only repeat dict
+stores the base import already performed — and would pin them against env
+overrides.
 
 - Debug disabled.
-- Strong security headers and HTTPS-only cookies.
-- HSTS enabled with preload and subdomains.
 - Use a real email backend (configure via env).
 """
 
@@ -17,17 +19,6 @@ from .base import *  # noqa: F403, F401
 # ---------------------------------------------------------------------
 DEBUG = False
 
-# ---------------------------------------------------------------------
-# Security
-# ---------------------------------------------------------------------
-# If you want to force stricter values than base auto-toggles, set them here:
-SECURE_SSL_REDIRECT = True
-SESSION_COOKIE_SECURE = True
-CSRF_COOKIE_SECURE = True
-SECURE_HSTS_SECONDS = 60 * 60 * 24 * 30  # 30 days
-SECURE_HSTS_INCLUDE_SUBDOMAINS = True
-SECURE_HSTS_PRELOAD = True
-
 # ---------------------------------------------------------------------
 # Email
 # ---------------------------------------------------------------------
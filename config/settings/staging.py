@@ -1,12 +1,12 @@
 """
 Staging settings for the Django project.
 
-This module extends the shared base settings (`base.py`) with configuration
-suitable for a staging/pre-production environment:
+This module extends the shared base settings (`base.py`) and keeps only the
+true staging deltas. SSL redirect, secure cookies, and the other security
+headers already come from `base.py`'s env-driven defaults.
 
 - Debug disabled.
-- SSL redirect + secure cookies on.
-- Short HSTS without preload.
+- Short HSTS without preload (avoid pinning test domains).
 - Console email to avoid sending real mail.
 """
 
@@ -21,12 +21,7 @@ DEBUG = False
 # Security
 # ---------------------------------------------------------------------
 # Short HSTS for staging (1 day) and no preload to avoid pinning test domains.
-SECURE_SSL_REDIRECT = True
-SESSION_COOKIE_SECURE = True
-CSRF_COOKIE_SECURE = True
-
-SECURE_HSTS_SECONDS = 60 * 60 * 24  # 1 day
-SECURE_HSTS_INCLUDE_SUBDOMAINS = True
+SECURE_HSTS_SECONDS = HSTS_ONE_DAY  # noqa: F405 — 1 day
 SECURE_HSTS_PRELOAD = False
 
 # ---------------------------------------------------------------------
@@ -5,20 +5,40 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import RedirectView
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
 from .views import HealthCheckView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include(("shop.urls", "shop"), namespace="shop")),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     path("api/health/", HealthCheckView.as_view(), name="health-check"),
     path("favicon.ico", RedirectView.as_view(url=settings.STATIC_URL + "favicon.ico")),
 ]
 
+# Schema/docs routes only where drf-spectacular is installed (dev); importing
+# its views here keeps production workers off its import graph.
+if "drf_spectacular" in settings.INSTALLED_APPS:
+    from django.views.decorators.cache import cache_page
+    from drf_spectacular.views import (
+        SpectacularAPIView,
+        SpectacularRedocView,
+        SpectacularSwaggerView,
+    )
+
+    # Schema generation introspects every view/serializer on each request;
+    # cache the rendered document so only the first hit pays that reflection.
+    _schema_max_age = getattr(settings, "OPENAPI_SCHEMA_CACHE_SECONDS", 3600)
+
+    urlpatterns += [
+        path(
+            "api/schema/",
+            cache_page(_schema_max_age)(SpectacularAPIView.as_view()),
+            name="schema",
+        ),
+        path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+        path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    ]
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
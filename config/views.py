@@ -7,30 +7,60 @@ Currently, includes:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from types import ModuleType
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, cast
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import connection as db_connection
 from django.db.utils import OperationalError
-from rest_framework.permissions import AllowAny
-from rest_framework.request import Request
-from rest_framework.response import Response
-from rest_framework.views import APIView
+from django.http import HttpRequest, JsonResponse
+from django.views import View
 
-try:
-    import redis as _redis
-except ImportError:
-    _redis = None  # type: ignore[assignment]
+logger = logging.getLogger(__name__)
 
-# Redis module if available, otherwise None. Kept broad for optional dependency.
-redis: ModuleType | None = _redis
 
-logger = logging.getLogger(__name__)
+@lru_cache(maxsize=1)
+def _redis_from_url() -> Callable[..., Any] | None:
+    """
+    Import `redis` once and return the bound `Redis.from_url` constructor.
+
+    Importing eagerly would drag the redis/hiredis graph into every process
+    that merely imports the URLconf (management commands, test collection);
+    binding the constructor here means later probes pay neither the import
+    nor a module attribute lookup. Returns None when the package is missing.
+    """
+    try:
+        from redis import Redis
+    except ImportError:
+        return None
+    return Redis.from_url
+
 
+@lru_cache(maxsize=1)
+def _redis_client(broker_url: str, timeout: float) -> Any:
+    """
+    Build the health-probe Redis client once and reuse its connection pool.
+
+    Kubernetes-style probes hit the endpoint every few seconds per pod;
+    rebuilding the client per request meant URL re-parsing plus a full TCP
+    handshake each time. On connection errors the caller clears this cache so
+    a broken pool is rebuilt on the next probe.
+    """
+    from_url = _redis_from_url()
+    assert from_url is not None  # callers check availability first
+    return from_url(
+        broker_url,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+        health_check_interval=30,
+    )
 
-class HealthCheckView(APIView):
+
+class HealthCheckView(View):
     """
     Health-check endpoint for monitoring and load balancers.
 
@@ -46,6 +76,12 @@ class HealthCheckView(APIView):
     like Kubernetes liveness/readiness probes, AWS ALB health checks, or
     monitoring dashboards can call it without credentials.
 
+    The DB and Redis probes run concurrently (async `get` + gather), so a
+    probe costs max(RTT_db, RTT_redis) instead of their sum. Both checks
+    stay synchronous under the hood — reusing the pooled Redis client from
+    worker threads keeps it loop-agnostic, which matters because WSGI spins
+    up a fresh event loop per async view call.
+
     Example responses:
 
         200 OK
@@ -70,17 +106,48 @@ class HealthCheckView(APIView):
         }
     """
 
-    # Explicitly public: no auth, allow any requester.
-    authentication_classes: list[Any] = []
-    permission_classes = [AllowAny]
-    throttle_classes: list[Any] = []
-
-    def get(
+    @staticmethod
+    def _check_db() -> bool:
+        """Open, validate, and release a probe connection to the default DB."""
+        try:
+            db_connection.ensure_connection()
+            # ensure_connection() is a no-op when a connection object already
+            # exists — and these probe threads never run the request-cycle
+            # close_old_connections() — so is_usable() does the real round
+            # trip that catches a server-side drop.
+            if db_connection.is_usable():
+                return True
+            logger.warning("DB health check failed: connection not usable")
+            return False
+        except OperationalError as e:
+            logger.warning("DB health check failed: %s", e)
+            return False
+        finally:
+            # This repo serves the app via gunicorn's WSGI entrypoint, where
+            # async views get a one-off event loop per request: each probe
+            # lands on a fresh executor thread and opens its own thread-local
+            # connection. Close it here — left open it would only leak with
+            # the dying thread, and the next probe redials regardless.
+            db_connection.close()
+
+    @staticmethod
+    def _check_redis(broker_url: str, timeout: float) -> bool:
+        """Ping Redis through the cached pooled client; rebuild pool on error."""
+        try:
+            _redis_client(broker_url, timeout).ping()
+            return True
+        except Exception as e:  # noqa: BLE001 — health endpoint should never crash
+            logger.warning("Redis health check failed: %s", e)
+            # Drop the cached client: its pool may hold dead sockets.
+            _redis_client.cache_clear()
+            return False
+
+    async def get(
         self: "HealthCheckView",
-        request: Request,
+        request: HttpRequest,
         *args: object,
         **kwargs: object,
-    ) -> Response:
+    ) -> JsonResponse:
         """
         Perform health checks for the database and (optionally) Redis, and return
         their status in a JSON response.
@@ -101,36 +168,29 @@ class HealthCheckView(APIView):
             "redis": None,  # None = not configured
         }
 
-        # --- Database check ---
-        try:
-            # Open a cursor, run a trivial query, then close immediately.
-            with db_connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-            result["database"] = True
-        except OperationalError as e:
-            logger.warning("DB health check failed: %s", e)
-            result["status"] = "error"
-            result["database"] = False
-
         broker_url = cast(str | None, getattr(settings, "CELERY_BROKER_URL", None))
         require_redis: bool = bool(getattr(settings, "HEALTH_REDIS_REQUIRED", False))
         redis_timeout: float = float(getattr(settings, "HEALTH_REDIS_TIMEOUT", 0.5))
 
-        # --- Redis check (optional) ---
-        if redis is not None and broker_url:
-            try:
-                r = cast(Any, redis).Redis.from_url(
-                    broker_url,
-                    socket_connect_timeout=redis_timeout,
-                    socket_timeout=redis_timeout,
-                    health_check_interval=0,  # explicit; we just ping once
-                )
-                r.ping()
-                result["redis"] = True
-            except Exception as e:  # noqa: BLE001 — health endpoint should never crash
-                logger.warning("Redis health check failed: %s", e)
-                result["redis"] = False
-                if require_redis:
-                    result["status"] = "error"
-
-        return Response(result)
+        check_redis = bool(broker_url) and _redis_from_url() is not None
+
+        # thread_sensitive=False puts each probe on its own worker thread so
+        # the two RTTs genuinely overlap instead of queueing on the single
+        # sync-friendly executor.
+        db_probe = sync_to_async(self._check_db, thread_sensitive=False)()
+        if check_redis:
+            redis_probe = sync_to_async(self._check_redis, thread_sensitive=False)(
+                cast(str, broker_url), redis_timeout
+            )
+            db_ok, redis_ok = await asyncio.gather(db_probe, redis_probe)
+            result["redis"] = redis_ok
+            if not redis_ok and require_redis:
+                result["status"] = "error"
+        else:
+            db_ok = await db_probe
+
+        result["database"] = db_ok
+        if not db_ok:
+            result["status"] = "error"
+
+        return JsonResponse(result)
@@ -1,11 +1,21 @@
 """Django admin configuration for categories, products, and orders."""
 
+from typing import Any, cast
+
 from django.contrib import admin
 from django.db.models import QuerySet
 from django.http import HttpRequest
-from django.utils.html import format_html
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
+
+from .models import Category, Order, OrderItem, Product, ProductQuerySet
+from .signals import batch_order_totals
+
 
-from .models import Category, Order, OrderItem, Product
+def _is_changelist(request: HttpRequest) -> bool:
+    """True when the request targets an admin changelist page."""
+    match = request.resolver_match
+    return bool(match and match.url_name and match.url_name.endswith("_changelist"))
 
 
 @admin.register(Category)
@@ -32,11 +42,27 @@ class ProductAdmin(admin.ModelAdmin):
     def get_queryset(self, request: HttpRequest) -> QuerySet[Product]:
         # Avoid N+1 on category in the changelist
         qs = super().get_queryset(request)
-        return qs.select_related("category")
+        qs = qs.select_related("category")
+        # The changelist renders only list_display; defer the wide columns
+        # (description, image) there. Change forms hydrate every field, so
+        # only() would cost one reload query per deferred field on edit.
+        if _is_changelist(request):
+            qs = qs.only("id", "name", "price", "thumbnail", "thumbnail_url", "category__name")
+        return qs
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[Product]) -> None:
+        # The bulk "delete selected" action is where mass deletes actually
+        # happen; route it through the batched delete so image files go out
+        # in storage-level batches instead of one post_delete per row.
+        cast(ProductQuerySet, queryset).bulk_delete_with_files()
 
     @admin.display(description="Thumbnail")
     def thumb_preview(self, obj: Product) -> str:
         """Small thumbnail in list view."""
+        # Prefer the URL cached at generation time: `thumbnail.url` asks the
+        # storage backend per row (URL signing on remote storages).
+        if obj.thumbnail_url:
+            return mark_safe(f'<img src="{escape(obj.thumbnail_url)}" alt="thumb" height="40">')
         if obj.thumbnail:
             return format_html('<img src="{url}" alt="thumb" height="40">', url=obj.thumbnail.url)
         return "—"
@@ -82,7 +108,26 @@ class OrderAdmin(admin.ModelAdmin):
     def get_queryset(self, request: HttpRequest) -> QuerySet[Order]:
         # Avoid N+1 on customer in the changelist
         qs = super().get_queryset(request)
-        return qs.select_related("customer")
+        qs = qs.select_related("customer")
+        # Changelist rows need list_display plus the joined username;
+        # shipping_address stays deferred. See ProductAdmin.get_queryset.
+        if _is_changelist(request):
+            qs = qs.only(
+                "id",
+                "created_at",
+                "payment_due_date",
+                "total_price",
+                "is_paid",
+                "payment_reminder_sent",
+                "customer__username",
+            )
+        return qs
+
+    def save_related(self, request: HttpRequest, form: Any, formsets: Any, change: bool) -> None:
+        # The inline formset saves items one by one; batching collapses the
+        # K per-item total recalculations into a single one per order.
+        with batch_order_totals():
+            super().save_related(request, form, formsets, change)
 
     @admin.action(description="Mark as paid")
     def mark_paid(self, request: HttpRequest, queryset: QuerySet[Order]) -> None:
@@ -1,11 +1,16 @@
 """App configuration for the Shop application.
 
 - Registers Django signal handlers on startup.
+- Logs whether Pillow links libjpeg-turbo (SIMD JPEG decode/encode).
 """
 
+import logging
+
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
+logger = logging.getLogger(__name__)
+
 
 class ShopConfig(AppConfig):
     """Django app config for the Shop app."""
@@ -17,3 +22,18 @@ class ShopConfig(AppConfig):
     def ready(self) -> None:
         # Import signal handlers so they get registered by Django.
         from . import signals  # noqa: F401
+
+        # Thumbnail generation leans on libjpeg-turbo's SIMD kernels; official
+        # Pillow wheels bundle it, but a from-source build against plain
+        # libjpeg would silently cost ~2-3x more CPU per encode. Surface that
+        # once at startup instead of as a mystery in profiles.
+        try:
+            from PIL import features
+
+            if not features.check("libjpeg_turbo"):
+                logger.warning(
+                    "Pillow is not linked against libjpeg-turbo; "
+                    "thumbnail generation will use scalar JPEG codecs."
+                )
+        except ImportError:  # pragma: no cover — Pillow is a hard dependency
+            pass
@@ -1,8 +1,31 @@
-"""FilterSet for the Product list endpoint."""
+"""FilterSet and filter backend for the Product list endpoint."""
+
+from typing import Any
 
 from django_filters import rest_framework as filters
+from rest_framework.request import Request
+
+from .models import Product
+
+
+class ShortCircuitFilterBackend(filters.DjangoFilterBackend):
+    """
+    DjangoFilterBackend that skips filterset construction on unfiltered requests.
+
+    Building the filterset instantiates a full Django form (field iteration,
+    widget construction, validation scaffolding) even when the request carries
+    no filter params at all — the common case for a plain catalogue browse.
+    When none of the declared filter names appear in the query string, the
+    queryset passes through untouched.
+    """
 
-from .models import Category, Product
+    def filter_queryset(self, request: Request, queryset: Any, view: Any) -> Any:
+        filterset_class = getattr(view, "filterset_class", None)
+        if filterset_class is not None and not (
+            request.query_params.keys() & filterset_class.base_filters.keys()
+        ):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
 
 
 class ProductFilter(filters.FilterSet):
@@ -20,8 +43,11 @@ class ProductFilter(filters.FilterSet):
     name = filters.CharFilter(field_name="name", lookup_expr="icontains")
     description = filters.CharFilter(field_name="description", lookup_expr="icontains")
 
-    # Category: by ID or by category name (handy in tests)
-    category = filters.ModelChoiceFilter(queryset=Category.objects.all())
+    # Category: by ID or by category name (handy in tests). A plain
+    # NumberFilter on the FK column skips the ModelChoiceFilter machinery,
+    # which evaluated Category.objects.all() for form choices and issued an
+    # existence SELECT per filtered request just to validate the id.
+    category = filters.NumberFilter(field_name="category_id")
     category_name = filters.CharFilter(field_name="category__name", lookup_expr="icontains")
 
     # Price: exact or range
@@ -67,16 +67,18 @@ class Command(BaseCommand):
         user_model = get_user_model()
         username_field: str = cast(str, getattr(user_model, "USERNAME_FIELD", "username"))
 
-        missing: list[str] = []
-        for username in usernames:
-            user = user_model.objects.filter(**{username_field: username}).first()
-            if not user:
-                missing.append(username)
-                continue
-
-            # Avoid `user.groups` for better type-checker compatibility:
-            group.user_set.add(user)  # idempotent; no explicit save() needed
+        # Resolve every username with a single SELECT instead of one query per
+        # user; missing names fall out as a set difference.
+        found = list(user_model.objects.filter(**{f"{username_field}__in": usernames}))
+        missing = set(usernames) - {cast(str, getattr(u, username_field)) for u in found}
+
+        # Avoid `user.groups` for better type-checker compatibility. One add()
+        # call inserts all memberships in a single batch; idempotent, no
+        # explicit save() needed.
+        group.user_set.add(*found)
+        for user in found:
+            username = cast(str, getattr(user, username_field))
             self.stdout.write(self.style.SUCCESS(f"Added '{username}' to '{group_name}'."))
 
         if missing:
-            raise CommandError(f"User(s) not found: {', '.join(missing)}")
+            raise CommandError(f"User(s) not found: {', '.join(sorted(missing))}")
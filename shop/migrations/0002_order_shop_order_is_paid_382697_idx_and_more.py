@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-27 23:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(
+                fields=['is_paid', 'payment_reminder_sent'], name='shop_order_is_paid_382697_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['payment_due_date', 'is_paid'], name='ord_due_unpaid_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-27 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0002_order_shop_order_is_paid_382697_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'price'], name='shop_produc_categor_d4b9f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'name'], name='shop_produc_categor_d70fb8_idx'),
+        ),
+    ]
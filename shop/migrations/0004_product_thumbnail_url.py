@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-28 00:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0003_product_shop_produc_categor_d4b9f0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='thumbnail_url',
+            field=models.CharField(
+                blank=True, editable=False, max_length=500, verbose_name='Thumbnail URL'
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.17 on 2026-08-28 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0004_product_thumbnail_url'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='ord_due_unpaid_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(
+                condition=models.Q(('is_paid', False), ('payment_reminder_sent', False)),
+                fields=['payment_due_date'],
+                name='order_due_pending_idx',
+            ),
+        ),
+    ]
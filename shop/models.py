@@ -8,6 +8,8 @@ Includes:
   a default payment due date set to +5 days.
 """
 
+import contextvars
+import logging
 from datetime import timedelta
 from decimal import Decimal
 from io import BytesIO
@@ -17,11 +19,21 @@ from typing import Any
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from PIL import Image, UnidentifiedImageError
 from PIL.Image import Image as PILImage
 
+logger = logging.getLogger(__name__)
+
+# True while ProductQuerySet.bulk_delete_with_files handles file removal
+# itself; the per-instance post_delete cleanup receiver checks this and
+# stands down (see shop/signals.py).
+_file_cleanup_suppressed: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "product_file_cleanup_suppressed", default=False
+)
+
 
 def product_image_upload(instance: "Product", filename: str) -> str:
     """
@@ -60,6 +72,50 @@ class Category(models.Model):
         return self.name
 
 
+class ProductQuerySet(models.QuerySet):
+    """Product queryset with a batched delete for mass cleanups."""
+
+    # boto3's DeleteObjects accepts at most 1000 keys per call; harmless
+    # batch bound for other backends.
+    _DELETE_BATCH = 1000
+
+    def bulk_delete_with_files(self) -> tuple[int, dict[str, int]]:
+        """Delete the selected products and their image files in batches.
+
+        The per-instance post_delete receiver removes files one storage call
+        at a time — a network round-trip each on remote storages. Here the
+        file names are collected up front, the rows deleted with the
+        receiver's file handling suppressed, and the files removed through
+        the storage's ``bulk_delete`` (when the backend offers one, e.g.
+        S3 DeleteObjects) in batches of 1000, falling back to per-file
+        deletes for local filesystem storage.
+
+        Returns:
+            The ``(total, per_model)`` tuple from ``QuerySet.delete()``.
+        """
+        names = [name for pair in self.values_list("image", "thumbnail") for name in pair if name]
+        token = _file_cleanup_suppressed.set(True)
+        try:
+            result = self.delete()
+        finally:
+            _file_cleanup_suppressed.reset(token)
+
+        storage = self.model._meta.get_field("image").storage
+        bulk_delete = getattr(storage, "bulk_delete", None)
+        if callable(bulk_delete):
+            for i in range(0, len(names), self._DELETE_BATCH):
+                bulk_delete(names[i : i + self._DELETE_BATCH])
+        else:
+            for name in names:
+                try:
+                    storage.delete(name)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning("Failed to delete file '%s': %s", name, e)
+        return result
+
+
 class Product(models.Model):
     """Product with pricing and images (original + auto-generated thumbnail)."""
 
@@ -81,17 +137,31 @@ class Product(models.Model):
     thumbnail = models.ImageField(
         "Thumbnail", upload_to=product_image_upload, blank=True, null=True, editable=False
     )
+    # Resolved storage URL for the thumbnail, captured at generation time.
+    # Rendering the admin changelist via `thumbnail.url` asks the storage
+    # backend per row — for remote storages (e.g. S3) that can mean signing
+    # a URL per product; this column is a plain string read instead.
+    thumbnail_url = models.CharField("Thumbnail URL", max_length=500, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     # Thumbnail generation config
     THUMB_MAX_WIDTH = 200
     THUMB_QUALITY = 85  # JPEG quality 1..95
 
+    objects = ProductQuerySet.as_manager()
+
     class Meta:
         ordering = ["name"]
         indexes = [
+            # Standalone name/price serve the default ORDER BY name and
+            # category-less price-range filters respectively.
             models.Index(fields=["name"]),
             models.Index(fields=["price"]),
+            # Composites cover the common filter shapes:
+            # WHERE category_id = ? AND price BETWEEN ? AND ?
+            # WHERE category_id = ? ORDER BY name
+            models.Index(fields=["category", "price"]),
+            models.Index(fields=["category", "name"]),
         ]
         verbose_name = "Product"
         verbose_name_plural = "Products"
@@ -99,29 +169,49 @@ class Product(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Remember the image name this instance was loaded/constructed with,
+        # so save() can detect changes in memory instead of re-SELECTing the
+        # row. Read from __dict__: the descriptor holds the raw name and the
+        # lookup stays free even for deferred fields.
+        self._loaded_image_name = self._raw_image_name() if self.pk else None
+
+    def _raw_image_name(self) -> str | None:
+        """Current image name without touching the DB (None when absent/empty)."""
+        raw = self.__dict__.get("image")
+        name = raw if isinstance(raw, str) else getattr(raw, "name", None)
+        return name or None
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         Save the product and (re)generate a thumbnail when the main image changes.
 
         We first persist the model to obtain a PK (so upload paths can include it),
         then create/refresh the thumbnail if needed, and finally persist the thumbnail path.
+        Image changes are detected by comparing against the name captured at
+        load time — no extra SELECT per save.
         """
-        image_changed = False
-
         if self.pk:
-            old = Product.objects.filter(pk=self.pk).only("image", "thumbnail").first()
-            if old and old.image != self.image:
-                image_changed = True
+            image_changed = self._raw_image_name() != self._loaded_image_name
         else:
             # New object — if an image is provided, generate a thumbnail after initial save.
             image_changed = bool(self.image)
 
         super().save(*args, **kwargs)
 
-        # Generate/update thumbnail if needed
+        # Queue thumbnail (re)generation instead of running the Pillow
+        # resize+encode inline: it blocks the request thread for hundreds of
+        # milliseconds on large uploads. on_commit ensures the worker only
+        # sees the row after this transaction lands. Dev/test run the task
+        # eagerly (CELERY_TASK_ALWAYS_EAGER), so behavior there is unchanged.
         if self.image and (image_changed or not self.thumbnail):
-            if self._generate_thumbnail():
-                super().save(update_fields=["thumbnail"])
+            from .tasks import generate_product_thumbnail
+
+            product_pk = self.pk
+            transaction.on_commit(lambda: generate_product_thumbnail.delay(product_pk))
+
+        self._loaded_image_name = self._raw_image_name()
 
     def _generate_thumbnail(self) -> bool:
         """
@@ -132,24 +222,27 @@ class Product(models.Model):
         """
         if not self.image:
             self.thumbnail = None
+            self.thumbnail_url = ""
             return False
 
         try:
             # Load source image
             self.image.open("rb")
             pil_img: PILImage = Image.open(self.image)
+
+            # For JPEG sources, let libjpeg decode at a reduced DCT scale
+            # (1/2, 1/4, 1/8) close to the target size: a 4000px photo never
+            # materializes at full resolution. No-op for other formats.
+            pil_img.draft("RGB", (self.THUMB_MAX_WIDTH * 2, self.THUMB_MAX_WIDTH * 20))
             pil_img.load()
 
             # Normalize color mode (e.g., PNG with alpha) to RGB for JPEG
             if pil_img.mode not in ("RGB", "L"):
                 pil_img = pil_img.convert("RGB")
 
-            # Resize if wider than the target width
-            w, h = pil_img.size
-            if w > self.THUMB_MAX_WIDTH:
-                new_w = self.THUMB_MAX_WIDTH
-                new_h = int(h * (new_w / w))
-                pil_img = pil_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            # In-place LANCZOS downscale to max width, aspect ratio preserved;
+            # never upscales, so narrow images pass through untouched.
+            pil_img.thumbnail((self.THUMB_MAX_WIDTH, 10**9), Image.Resampling.LANCZOS)
 
             # Save to memory as JPEG
             out = BytesIO()
@@ -162,6 +255,7 @@ class Product(models.Model):
             full_thumb_path = f"{folder}/{thumb_name}"
 
             self.thumbnail.save(full_thumb_path, ContentFile(out.read()), save=False)
+            self.thumbnail_url = self.thumbnail.url
             return True
         except (UnidentifiedImageError, OSError, ValueError):
             # Invalid image, IO error, or corrupted file – do not block product save.
@@ -192,7 +286,19 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
-        indexes = [models.Index(fields=["created_at"])]
+        indexes = [
+            models.Index(fields=["created_at"]),
+            # Admin changelist filters combine these two flags.
+            models.Index(fields=["is_paid", "payment_reminder_sent"]),
+            # Reminder job: WHERE payment_due_date = ? AND is_paid = false
+            # AND payment_reminder_sent = false. Partial: indexes only the
+            # still-pending rows, so it stays tiny as paid orders accumulate.
+            models.Index(
+                fields=["payment_due_date"],
+                name="order_due_pending_idx",
+                condition=models.Q(is_paid=False, payment_reminder_sent=False),
+            ),
+        ]
         verbose_name = "Order"
         verbose_name_plural = "Orders"
 
@@ -211,12 +317,21 @@ class Order(models.Model):
     def recalculate_totals(self) -> None:
         """
         Recompute and persist the order's total price from its items.
+
+        The sum runs as a single SQL aggregate — no item rows are hydrated —
+        and the result is written with a queryset UPDATE (no save() signals).
+        The in-memory instance is kept in sync for callers holding it.
         """
-        total = Decimal("0.00")
-        for item in self.items.all():
-            total += item.quantity * item.unit_price
+        money: models.DecimalField = models.DecimalField(max_digits=12, decimal_places=2)
+        total = OrderItem.objects.filter(order=self).aggregate(
+            total=Coalesce(
+                models.Sum(models.F("quantity") * models.F("unit_price"), output_field=money),
+                Decimal("0.00"),
+                output_field=money,
+            )
+        )["total"]
+        Order.objects.filter(pk=self.pk).update(total_price=total)
         self.total_price = total
-        super().save(update_fields=["total_price"])
 
 
 class OrderItem(models.Model):
@@ -251,5 +366,13 @@ class OrderItem(models.Model):
         Snapshot the product price into unit_price on creation if not provided.
         """
         if self._state.adding and getattr(self, "unit_price", None) is None:
-            self.unit_price = self.product.price
+            if "product" in self._state.fields_cache:
+                # Related instance already in memory (e.g. set by a serializer)
+                self.unit_price = self.product.price
+            else:
+                # Only product_id is known — fetch just the price column
+                # instead of dereferencing the FK into a full Product row.
+                self.unit_price = Product.objects.filter(pk=self.product_id).values_list(
+                    "price", flat=True
+                ).first() or Decimal("0.00")
         super().save(*args, **kwargs)
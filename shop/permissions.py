@@ -7,16 +7,51 @@ from django.contrib.auth.models import AnonymousUser
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 
+# Session key holding the seller flag, seeded at login (see shop/signals.py)
+# and backfilled on first check for sessions predating the flag.
+SELLER_SESSION_KEY = "is_seller"
 
-def is_seller(user: Any) -> bool:
+
+def is_seller(user: Any, request: Request | None = None) -> bool:
     """
     Treat a user as a 'seller' if they belong to the configured auth group.
     (No is_staff check here – group membership only.)
+
+    The result is memoized on the user instance: DRF evaluates permissions
+    per request and again per object, so a list response would otherwise run
+    the same group-membership SELECT once per row. A user instance lives for
+    one request, so staleness is bounded to that request.
+
+    When a request with a session is passed, the flag cached there at login
+    is consulted before hitting the DB, so repeated write requests from the
+    same session cost zero queries. Membership changes made mid-session show
+    up on the next login (acceptable: the seller group changes via an
+    operator command, not self-service).
     """
     if not user or isinstance(user, AnonymousUser) or not getattr(user, "is_authenticated", False):
         return False
+    cached = getattr(user, "_is_seller_cache", None)
+    if cached is not None:
+        return cast(bool, cached)
+
+    session = getattr(request, "session", None) if request is not None else None
+    if session is not None:
+        flag = session.get(SELLER_SESSION_KEY)
+        if flag is not None:
+            user._is_seller_cache = bool(flag)
+            return bool(flag)
+
     group_name = getattr(settings, "SHOP_SELLER_GROUP", "seller")
-    return cast(bool, user.groups.filter(name=group_name).exists())
+    if "groups" in getattr(user, "_prefetched_objects_cache", {}):
+        # Groups already in memory (view/middleware prefetch): a generator
+        # scan beats re-asking the DB what it just told us.
+        result = any(g.name == group_name for g in user.groups.all())
+    else:
+        result = cast(bool, user.groups.filter(name=group_name).exists())
+    user._is_seller_cache = result
+    if session is not None:
+        session[SELLER_SESSION_KEY] = result
+    return result
 
 
 class IsSellerOrReadOnly(BasePermission):
@@ -25,16 +60,16 @@ class IsSellerOrReadOnly(BasePermission):
     def has_permission(self, request: Request, view: Any) -> bool:
         if request.method in SAFE_METHODS:
             return True
-        return is_seller(request.user)
+        return is_seller(request.user, request)
 
     def has_object_permission(self, request: Request, view: Any, obj: Any) -> bool:
         if request.method in SAFE_METHODS:
             return True
-        return is_seller(request.user)
+        return is_seller(request.user, request)
 
 
 class IsSeller(BasePermission):
     """Access limited to sellers (group-based)."""
 
     def has_permission(self, request: Request, view: Any) -> bool:
-        return is_seller(request.user)
+        return is_seller(request.user, request)
@@ -1,15 +1,16 @@
 """DRF serializers for categories, products, orders, and stats."""
 
 import logging
+from datetime import timedelta
 from decimal import Decimal
 from typing import Any, List, Optional
 
-from django.core.mail import send_mail
 from django.db import DatabaseError, transaction
 from django.utils import timezone
 from rest_framework import serializers
 
 from .models import Category, Order, OrderItem, Product
+from .tasks import send_order_confirmation
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +64,14 @@ class ProductSerializer(serializers.ModelSerializer):
 
 
 class OrderItemCreateSerializer(serializers.Serializer):
-    """Input for a single order line when creating an order."""
+    """Input for a single order line when creating an order.
 
-    product = serializers.PrimaryKeyRelatedField(queryset=Product.objects.all())
+    `product` stays a plain integer here; `OrderCreateSerializer.validate_items`
+    resolves all lines with one `in_bulk` query (a PrimaryKeyRelatedField would
+    SELECT per line).
+    """
+
+    product = serializers.IntegerField(min_value=1)
     quantity = serializers.IntegerField(min_value=1)
 
 
@@ -84,6 +90,40 @@ class OrderDetailSerializer(serializers.ModelSerializer):
 
     items = OrderDetailItemSerializer(many=True, read_only=True)
 
+    @classmethod
+    def setup_eager_loading(cls, queryset: Any) -> Any:
+        """
+        Apply the joins/prefetches this serializer's output requires.
+
+        Rendering `items` with `product_name` from a bare queryset costs
+        1 + N_orders * N_items queries; with `customer` joined and items
+        prefetched alongside their products it is a flat 2. Views serving
+        this serializer (e.g. OrderViewSet) must pass their queryset through
+        here instead of hand-maintaining the prefetch list.
+
+        Both the outer query and the prefetch are narrowed with only() to
+        the columns this serializer renders — a 1000-order seller listing
+        otherwise drags every Product column (description included) along
+        for each of its line items.
+        """
+        from django.db.models import Prefetch
+
+        item_qs = OrderItem.objects.select_related("product").only(
+            "order_id", "product_id", "quantity", "unit_price", "product__name"
+        )
+        return (
+            queryset.select_related("customer")
+            .only(
+                "id",
+                "shipping_address",
+                "created_at",
+                "payment_due_date",
+                "total_price",
+                "customer__id",  # rendered as a bare PK
+            )
+            .prefetch_related(Prefetch("items", queryset=item_qs))
+        )
+
     class Meta:
         model = Order
         fields = [
@@ -124,9 +164,24 @@ class OrderCreateSerializer(serializers.Serializer):
 
     @staticmethod
     def validate_items(items: List[dict]) -> List[dict]:
-        """Require a non-empty items list."""
+        """
+        Require a non-empty items list and resolve all products in one query.
+
+        Replaces each line's product id with the Product instance so that
+        `create()` works with real objects; `in_bulk` keeps validation at a
+        single SELECT no matter how many lines the cart has.
+        """
         if not items:
             raise serializers.ValidationError("Items list must not be empty.")
+        ids = {item["product"] for item in items}
+        products = Product.objects.in_bulk(ids)
+        missing = ids - products.keys()
+        if missing:
+            raise serializers.ValidationError(
+                f"Unknown product id(s): {', '.join(str(pk) for pk in sorted(missing))}."
+            )
+        for item in items:
+            item["product"] = products[item["product"]]
         return items
 
     def create(self, validated_data: dict[str, Any]) -> Order:
@@ -137,31 +192,37 @@ class OrderCreateSerializer(serializers.Serializer):
         full_name = validated_data.pop("full_name", "").strip()
         items_in = validated_data.pop("items")
 
+        # Total and due date are known before the order row exists (products
+        # are already resolved), so the order is INSERTed complete — no
+        # trailing UPDATE on the checkout path.
+        total = Decimal("0.00")
+        for item in items_in:
+            total += item["product"].price * int(item["quantity"])
+
         with transaction.atomic():
-            order = Order.objects.create(customer=user, **validated_data)
-
-            # Build line items and compute total
-            total = Decimal("0.00")
-            order_items: List[OrderItem] = []
-            for item in items_in:
-                product = item["product"]
-                qty = int(item["quantity"])
-                unit_price = product.price
-                order_items.append(
-                    OrderItem(order=order, product=product, quantity=qty, unit_price=unit_price)
+            order = Order.objects.create(
+                customer=user,
+                total_price=total,
+                payment_due_date=timezone.localdate() + timedelta(days=5),
+                **validated_data,
+            )
+
+            order_items: List[OrderItem] = [
+                OrderItem(
+                    order=order,
+                    product=item["product"],
+                    quantity=int(item["quantity"]),
+                    unit_price=item["product"].price,
                 )
-                total += unit_price * qty
-
-            OrderItem.objects.bulk_create(order_items)
-            order.total_price = total
-
-            # Ensure payment due date is set (+5 days from today)
-            if not order.payment_due_date:
-                from datetime import timedelta
-
-                order.payment_due_date = timezone.localdate() + timedelta(days=5)
+                for item in items_in
+            ]
 
-            order.save(update_fields=["total_price", "payment_due_date"])
+            # batch_size bounds the INSERT: 500 rows × a handful of columns
+            # stays far under PostgreSQL's 65535-parameter limit and keeps
+            # statement memory predictable for very large carts. unit_price is
+            # set explicitly above, so the model's save()-time snapshot branch
+            # being bypassed by bulk_create is intentional.
+            OrderItem.objects.bulk_create(order_items, batch_size=500)
 
         # Best-effort: update user's name if provided
         if full_name:
@@ -184,30 +245,13 @@ class OrderCreateSerializer(serializers.Serializer):
                 # Don't fail order creation because of a profile update hiccup
                 logger.warning("Failed to update user's name (id=%s): %s", user.pk, e)
 
-        self._send_confirmation_email(user, order)
+        # Email leaves the request thread entirely: the task fires only after
+        # the surrounding transaction commits, so checkout neither waits on
+        # the SMTP handshake nor mails rolled-back orders.
+        order_pk = order.pk
+        transaction.on_commit(lambda: send_order_confirmation.delay(order_pk))
         return order
 
-    @staticmethod
-    def _send_confirmation_email(user: Any, order: Order) -> None:
-        """Send a plain-text confirmation email (console backend in dev)."""
-        lines = [
-            f"Hi {user.get_full_name() or user.username},",
-            f"Thank you for your order #{order.pk}.",
-            f"Total: {order.total_price} PLN",
-            f"Payment due date: {order.payment_due_date}",
-            "",
-            "Items:",
-        ]
-        for it in order.items.select_related("product"):
-            lines.append(f"- {it.product.name} × {it.quantity} = {it.unit_price * it.quantity} PLN")
-        send_mail(
-            subject=f"Order confirmation #{order.pk}",
-            message="\n".join(lines),
-            from_email=None,  # uses DEFAULT_FROM_EMAIL; with console backend it prints to stdout
-            recipient_list=[user.email] if user.email else [],
-            fail_silently=True,
-        )
-
 
 # ---------------------------------- Stats ------------------------------------
 
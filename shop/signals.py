@@ -8,18 +8,60 @@
   real file/path issues are logged (but do not crash the signal).
 """
 
+import contextvars
 import logging
-from contextlib import suppress
-from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from typing import Any, Optional
 
+from django.contrib.auth.signals import user_logged_in
 from django.core.exceptions import SuspiciousFileOperation
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.http import HttpRequest
 
-from .models import OrderItem, Product
+from .models import Order, OrderItem, Product, _file_cleanup_suppressed
+from .permissions import SELLER_SESSION_KEY, is_seller
 
 logger = logging.getLogger(__name__)
 
+# When set (inside batch_order_totals), the OrderItem receivers park the
+# affected order PKs here instead of recalculating immediately.
+_pending_order_totals: contextvars.ContextVar[Optional[set[int]]] = contextvars.ContextVar(
+    "pending_order_totals", default=None
+)
+
+
+@contextmanager
+def batch_order_totals() -> Iterator[None]:
+    """Defer order-total recalculation until the end of the block.
+
+    Saving a K-item order one item at a time (e.g. the admin inline
+    formset) fires the post_save receiver K times, each running a fresh
+    aggregate over the same order's items. Inside this block the receivers
+    only record the order PKs; on clean exit each distinct order is
+    recalculated exactly once. Nothing is recalculated if the block raises —
+    in the admin that means the surrounding transaction rolled back anyway.
+    """
+    pending: set[int] = set()
+    token = _pending_order_totals.set(pending)
+    try:
+        yield
+    finally:
+        _pending_order_totals.reset(token)
+    for order in Order.objects.filter(pk__in=pending).only("id"):
+        order.recalculate_totals()
+
+
+@receiver(user_logged_in, dispatch_uid="seed_seller_session_flag")
+def seed_seller_flag_on_login(sender: Any, request: HttpRequest, user: Any, **kwargs: Any) -> None:
+    """Cache seller-group membership in the session at login.
+
+    One SELECT here spares the permission layer a group-membership query on
+    every subsequent write request in the session (see ``is_seller``).
+    """
+    request.session[SELLER_SESSION_KEY] = is_seller(user)
+
 
 @receiver(
     post_save,
@@ -30,6 +72,12 @@ def recalc_order_total_on_orderitem_save(
     sender: type[OrderItem], instance: OrderItem, **kwargs: Any
 ) -> None:
     """Recompute the parent order's total after saving an OrderItem."""
+    pending = _pending_order_totals.get()
+    if pending is not None:
+        # Batched (see batch_order_totals): order_id avoids even the
+        # parent-order SELECT that instance.order would trigger.
+        pending.add(instance.order_id)
+        return
     instance.order.recalculate_totals()
 
 
@@ -42,6 +90,10 @@ def recalc_order_total_on_orderitem_delete(
     sender: type[OrderItem], instance: OrderItem, **kwargs: Any
 ) -> None:
     """Recompute the parent order's total after deleting an OrderItem."""
+    pending = _pending_order_totals.get()
+    if pending is not None:
+        pending.add(instance.order_id)
+        return
     instance.order.recalculate_totals()
 
 
@@ -58,10 +110,16 @@ def cleanup_product_files_after_delete(
 
     - Silently ignore missing files (FileNotFoundError).
     - Log filesystem/path problems (OSError, SuspiciousFileOperation).
+    - Stand down while ProductQuerySet.bulk_delete_with_files is handling
+      file removal in storage-level batches.
     """
-    for field in ("image", "thumbnail"):
-        f = getattr(instance, field, None)
-        if not f or not getattr(f, "name", None) or not getattr(f, "storage", None):
+    if _file_cleanup_suppressed.get():
+        return
+    # image/thumbnail are declared FileFields, so the descriptors always
+    # yield a FieldFile with .name/.storage — direct access beats the
+    # defensive getattr chain this used to run per product.
+    for f in (instance.image, instance.thumbnail):
+        if not f or not f.name:
             continue
 
         # FileSystemStorage.delete() already ignores missing files, but other
@@ -8,20 +8,199 @@ from __future__ import annotations
 
 import logging
 import smtplib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Any, Final, Optional
 
 from celery import Task, shared_task
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db import connection as db_connection
+from django.db import transaction
 from django.utils import timezone
 
-from .models import Order
+# Importing the project app makes it the current Celery app before any
+# .delay() call from this module's tasks. config/__init__ resolves celery_app
+# lazily, so without this a web process publishing its first task would fall
+# back to Celery's unconfigured default app (amqp://localhost, no eager mode).
+from config.celery import app as _celery_app  # noqa: F401
+
+from .models import Order, OrderItem, Product
 
 logger = logging.getLogger(__name__)
 
 # Batch size used when iterating through querysets in tasks
 _CHUNK_SIZE: Final[int] = 500
 
+# Messages to push through one SMTP connection before rotating it; relays
+# commonly cap messages-per-connection around this order of magnitude.
+_SMTP_BATCH_SIZE: Final[int] = 1000
+
+# Reminder email template, hoisted so the hot send loop formats one string
+# instead of building and joining a fresh list per message.
+_REMINDER_SUBJECT: Final[str] = "Payment reminder for order #{pk}"
+_REMINDER_BODY: Final[str] = (
+    "Hi {greeting},\n"
+    "This is a reminder to pay for order #{pk}.\n"
+    "Total: {total} PLN\n"
+    "Payment due date: {due}\n"
+    "\n"
+    "If you have already paid, you can ignore this message."
+)
+
+
+# Worker threads for per-domain SMTP sending; bounded so a run with many
+# distinct recipient domains can't stampede the relay.
+_SMTP_MAX_WORKERS: Final[int] = 8
+
+# (order pk, total, due date, email, greeting) — precomputed per reminder
+_ReminderRow = tuple[int, Any, Any, str, str]
+
+
+def _send_with_reconnect(msg: EmailMessage, connection: Any) -> int:
+    """Send one message, reopening the shared SMTP connection once on failure.
+
+    A long-lived connection can be dropped server-side between messages;
+    recovering here keeps one bad send from tearing down (and re-running)
+    the whole batch via task autoretry. A second consecutive failure
+    propagates normally.
+    """
+    try:
+        return int(msg.send())
+    except smtplib.SMTPException:
+        connection.close()
+        connection.open()
+        return int(msg.send())
+
+
+def _send_domain_batch(batch: list[_ReminderRow]) -> tuple[list[int], Optional[BaseException]]:
+    """Send one recipient domain's reminders over a dedicated SMTP connection.
+
+    Runs on a pool thread; touches no ORM state (the rows are plain tuples),
+    so it is safe without a per-thread DB connection. The connection is
+    rotated every _SMTP_BATCH_SIZE messages to respect relay caps.
+
+    Returns:
+        The PKs of orders whose mail was handed to the backend, plus the
+        error that stopped the batch early (None on a clean run) — returned
+        rather than raised so the caller can flag the delivered PKs before
+        deciding to retry.
+    """
+    connection = get_connection()
+    delivered_pks: list[int] = []
+    on_connection = 0
+    try:
+        for pk, total, due, email, greeting in batch:
+            if on_connection >= _SMTP_BATCH_SIZE:
+                connection.close()
+                on_connection = 0
+
+            msg = EmailMessage(
+                subject=_REMINDER_SUBJECT.format(pk=pk),
+                body=_REMINDER_BODY.format(greeting=greeting, pk=pk, total=total, due=due),
+                from_email=None,  # uses DEFAULT_FROM_EMAIL
+                to=[email],
+                connection=connection,
+            )
+            try:
+                # send() returns 1 on success
+                delivered = _send_with_reconnect(msg, connection)
+            except (smtplib.SMTPException, OSError) as e:
+                # Leave the rest of this domain for the task-level retry.
+                return delivered_pks, e
+            on_connection += 1
+
+            if delivered:
+                delivered_pks.append(pk)
+                logger.info("Payment reminder sent | order=%s email=%s", pk, email)
+            else:
+                logger.warning("send returned 0 | order=%s email=%s", pk, email)
+    finally:
+        connection.close()
+    return delivered_pks, None
+
+
+@shared_task(ignore_result=True)
+def send_order_confirmation(order_id: int) -> bool:
+    """Send the order confirmation email, off the checkout request path.
+
+    Scheduled from ``OrderCreateSerializer.create`` via
+    ``transaction.on_commit``, so checkout never blocks on the SMTP
+    handshake and rolled-back orders never produce mail.
+
+    Returns:
+        bool: True when the email was handed to the backend, False when the
+        order vanished meanwhile or the customer has no email address.
+    """
+    from django.db.models import Prefetch
+
+    order = (
+        Order.objects.select_related("customer")
+        .prefetch_related(Prefetch("items", queryset=OrderItem.objects.select_related("product")))
+        .filter(pk=order_id)
+        .first()
+    )
+    if order is None:
+        logger.debug("Confirmation task: order %s gone -> skip", order_id)
+        return False
+
+    user = order.customer
+    if not user.email:
+        logger.debug("Confirmation task: order %s customer has no email -> skip", order_id)
+        return False
+
+    lines = [
+        f"Hi {user.get_full_name() or user.username},",
+        f"Thank you for your order #{order.pk}.",
+        f"Total: {order.total_price} PLN",
+        f"Payment due date: {order.payment_due_date}",
+        "",
+        "Items:",
+    ]
+    for it in order.items.all():
+        lines.append(f"- {it.product.name} × {it.quantity} = {it.unit_price * it.quantity} PLN")
+
+    delivered = send_mail(
+        subject=f"Order confirmation #{order.pk}",
+        message="\n".join(lines),
+        from_email=None,  # uses DEFAULT_FROM_EMAIL
+        recipient_list=[user.email],
+        fail_silently=True,
+    )
+    return bool(delivered)
+
+
+@shared_task(ignore_result=True)
+def generate_product_thumbnail(product_id: int) -> bool:
+    """Generate/refresh the thumbnail for one product, off the request thread.
+
+    Scheduled from ``Product.save`` via ``transaction.on_commit`` whenever the
+    image changes, so product writes return without paying the Pillow
+    resize + JPEG encode inline.
+
+    The thumbnail path is persisted with a queryset ``update`` — not
+    ``save()`` — to avoid re-entering the model's change-detection logic and
+    any save signals.
+
+    Returns:
+        bool: True if a thumbnail was generated and stored, False otherwise
+        (product deleted meanwhile, image removed, or unreadable file).
+    """
+    product = Product.objects.filter(pk=product_id).first()
+    if product is None or not product.image:
+        logger.debug("Thumbnail task: product %s gone or imageless -> skip", product_id)
+        return False
+
+    if not product._generate_thumbnail():
+        return False
+
+    Product.objects.filter(pk=product_id).update(
+        thumbnail=product.thumbnail.name,
+        thumbnail_url=product.thumbnail_url,
+    )
+    logger.info("Thumbnail generated | product=%s file=%s", product_id, product.thumbnail.name)
+    return True
+
 
 class TaskRequestLike:
     """Minimal interface to describe Celery's Task.request object."""
@@ -56,6 +235,9 @@ class PaymentReminderTask(Task):
 @shared_task(
     bind=True,
     base=PaymentReminderTask,
+    # Beat-scheduled; nothing reads the result, so skip persisting it to the
+    # backend. The return value still lands in the worker log via task trace.
+    ignore_result=True,
     autoretry_for=(smtplib.SMTPException, OSError),
     retry_backoff=True,
     retry_jitter=True,
@@ -68,65 +250,97 @@ def send_payment_reminders(_self: PaymentReminderTask) -> int:
     Business rules:
       * Skip orders already paid or already reminded.
       * Count only successfully sent emails in the return value.
-      * Mark ``payment_reminder_sent=True`` after a successful send.
+      * Orders are claimed (``payment_reminder_sent=True``) before sending;
+        claims for emails that then fail to send are released for retry.
 
-    Notes:
-      * Without a dedicated "claimed" field, two workers could race and send duplicates.
-        In typical setups (single beat + single worker) this is acceptable.
-        For strict idempotency across workers, introduce a claim/lock field on ``Order``.
+    Concurrency:
+      * Each chunk is claimed inside a transaction with
+        ``SELECT ... FOR UPDATE SKIP LOCKED`` (where the backend supports
+        it), so multiple workers can run this task concurrently and split
+        the due orders between them without duplicate sends.
 
     Returns:
         int: Number of successfully sent reminders.
     """
     tomorrow = timezone.localdate() + timedelta(days=1)
+    predicate = {
+        "payment_due_date": tomorrow,
+        "is_paid": False,
+        "payment_reminder_sent": False,
+    }
+    skip_locked = db_connection.features.has_select_for_update_skip_locked
 
-    # Select all unpaid, unreminded orders with due date = tomorrow
-    qs = (
-        Order.objects.select_related("customer")
-        .filter(
-            payment_due_date=tomorrow,
-            is_paid=False,
-            payment_reminder_sent=False,
+    # Claim-then-send: flip the flag on a chunk of due orders atomically,
+    # then mail outside the transaction. SKIP LOCKED makes concurrent
+    # workers pass over each other's in-flight chunks instead of blocking
+    # or double-sending. (No ORDER BY: claim order is irrelevant, and a
+    # global sort would force the server to materialize the result.)
+    claimed: list[tuple] = []
+    while True:
+        with transaction.atomic():
+            claim_qs = Order.objects.filter(**predicate).order_by()
+            if skip_locked:
+                claim_qs = claim_qs.select_for_update(skip_locked=True)
+            batch = list(claim_qs.values_list("pk", flat=True)[:_CHUNK_SIZE])
+            if not batch:
+                break
+            Order.objects.filter(pk__in=batch).update(payment_reminder_sent=True)
+        # values_list keeps the rows to the scalars the email body actually
+        # uses and skips Order/User instance construction entirely: bare
+        # tuples, no field descriptors, no reference cycles.
+        claimed.extend(
+            Order.objects.filter(pk__in=batch)
+            .order_by()
+            .values_list(
+                "pk",
+                "total_price",
+                "payment_due_date",
+                "customer__email",
+                "customer__first_name",
+                "customer__last_name",
+                "customer__username",
+            )
         )
-        .order_by("pk")
-    )
 
-    sent = 0
-    # Iterate in chunks to avoid loading too many rows into memory
-    for order in qs.iterator(chunk_size=_CHUNK_SIZE):
-        email = getattr(order.customer, "email", None)
+    # Bucket reminders by recipient domain: each domain resolves to one MX,
+    # so one worker (with its own SMTP connection) per domain overlaps the
+    # latency-bound exchanges instead of serializing them on a single socket.
+    buckets: defaultdict[str, list[_ReminderRow]] = defaultdict(list)
+    for pk, total, due, email, first, last, username in claimed:
         if not email:
-            logger.debug("Order %s: no email for customer -> skip", order.pk)
+            # Stays claimed: there is nothing to send for this order, and
+            # releasing it would just re-scan the same dead row every night.
+            logger.debug("Order %s: no email for customer -> skip", pk)
             continue
+        greeting = f"{first} {last}".strip() or username or "Customer"
+        buckets[email.rsplit("@", 1)[-1].lower()].append((pk, total, due, email, greeting))
 
-        greeting = (
-            order.customer.get_full_name() or getattr(order.customer, "username", "") or "Customer"
-        )
-        body_lines = [
-            f"Hi {greeting},",
-            f"This is a reminder to pay for order #{order.pk}.",
-            f"Total: {order.total_price} PLN",
-            f"Payment due date: {order.payment_due_date}",
-            "",
-            "If you have already paid, you can ignore this message.",
-        ]
-        # send_mail returns 1 on success
-        delivered = send_mail(
-            subject=f"Payment reminder for order #{order.pk}",
-            message="\n".join(body_lines),
-            from_email=None,  # uses DEFAULT_FROM_EMAIL
-            recipient_list=[email],
-            fail_silently=False,
-        )
+    sent_pks: list[int] = []
+    failed_pks: list[int] = []
+    first_error: Optional[BaseException] = None
+    if buckets:
+        with ThreadPoolExecutor(max_workers=min(_SMTP_MAX_WORKERS, len(buckets))) as pool:
+            results = pool.map(_send_domain_batch, buckets.values())
+            for batch_rows, (delivered, error) in zip(buckets.values(), results):
+                sent_pks.extend(delivered)
+                if error is not None:
+                    done = set(delivered)
+                    failed_pks.extend(pk for pk, *_ in batch_rows if pk not in done)
+                    if first_error is None:
+                        first_error = error
 
-        if delivered:
-            # Mark reminder as sent
-            order.payment_reminder_sent = True
-            order.save(update_fields=["payment_reminder_sent"])
-            sent += 1
-            logger.info("Payment reminder sent | order=%s email=%s", order.pk, email)
-        else:
-            logger.warning("send_mail returned 0 | order=%s email=%s", order.pk, email)
+    if failed_pks:
+        # Release the claims whose mail never went out so the retry (or the
+        # next run) picks them up again; delivered ones stay flagged, so a
+        # retry can never duplicate mail that already left the relay.
+        for i in range(0, len(failed_pks), _CHUNK_SIZE):
+            Order.objects.filter(pk__in=failed_pks[i : i + _CHUNK_SIZE]).update(
+                payment_reminder_sent=False
+            )
 
+    sent = len(sent_pks)
     logger.info("Payment reminders summary | sent=%s", sent)
+    if first_error is not None:
+        # Surfaces to autoretry; the released remainder goes out next run.
+        raise first_error
     return sent
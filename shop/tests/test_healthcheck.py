@@ -2,23 +2,35 @@ import pytest
 from django.test import Client
 from django.urls import reverse
 
+from config.views import HealthCheckView
 
-@pytest.mark.django_db
-def test_healthcheck_ok(client: Client) -> None:
+
+@pytest.fixture
+def healthy_probes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub the DB and Redis probes so the endpoint needs no real services.
+
+    Without the django_db marker pytest-django blocks DB access entirely,
+    so the test also guards against the healthcheck (or middleware on its
+    path) growing an accidental query.
+    """
+    monkeypatch.setattr(HealthCheckView, "_check_db", staticmethod(lambda: True))
+    monkeypatch.setattr(
+        HealthCheckView, "_check_redis", staticmethod(lambda broker_url, timeout: True)
+    )
+
+
+def test_healthcheck_ok(client: Client, healthy_probes: None) -> None:
     """
     Basic health check endpoint should return HTTP 200 and
     contain status + database info in JSON payload.
     """
-    url = reverse("healthcheck")
-    response = client.get(url)
+    url = reverse("health-check")
+    response = client.get(url, secure=True)
 
     assert response.status_code == 200
     data = response.json()
 
-    assert "status" in data
-    assert "database" in data
-    assert "redis" in data
-
-    assert data["status"] in ("ok", "error")
-    assert isinstance(data["database"], bool)
-    assert data["redis"] in (True, False, None)
+    assert data["status"] == "ok"
+    assert data["database"] is True
+    # None when Redis isn't configured in the settings under test
+    assert data["redis"] in (True, None)
@@ -0,0 +1,50 @@
+"""Custom password validators for the Shop API.
+
+Currently includes:
+- LazyCommonPasswordValidator: drop-in replacement for Django's
+  CommonPasswordValidator that defers loading the ~20k-entry gzipped
+  wordlist until the first `validate()` call.
+"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from typing import Any
+
+from django.contrib.auth.password_validation import CommonPasswordValidator
+
+
+class LazyCommonPasswordValidator(CommonPasswordValidator):
+    """
+    CommonPasswordValidator that loads its password list lazily.
+
+    Django's stock validator reads and decompresses the wordlist in
+    `__init__`, i.e. at settings/validator-instantiation time — a cost paid by
+    every process even when no password is ever validated. This subclass only
+    stores the path and populates `passwords` on the first `validate()` call.
+    """
+
+    def __init__(
+        self, password_list_path: Path | str = CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH
+    ) -> None:
+        # Intentionally no super().__init__(): that's where the eager load lives.
+        if password_list_path is CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH:
+            password_list_path = self.DEFAULT_PASSWORD_LIST_PATH
+        self.password_list_path = password_list_path
+        # `passwords` stays the plain writable attribute the base class
+        # declares; it is simply assigned on first use instead of here.
+
+    def _load_passwords(self) -> set[str]:
+        """Read the wordlist (mirrors Django's eager loader)."""
+        try:
+            with gzip.open(self.password_list_path, "rt", encoding="utf-8") as f:
+                return {p.strip() for p in f}
+        except OSError:
+            with open(self.password_list_path, encoding="utf-8") as f:
+                return {p.strip() for p in f}
+
+    def validate(self, password: str, user: Any = None) -> None:
+        if not hasattr(self, "passwords"):
+            self.passwords = self._load_passwords()
+        super().validate(password, user)
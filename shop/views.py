@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import datetime, time, timedelta
 from typing import TYPE_CHECKING, Any, Type, cast
 
-from django.db.models import Sum
-from django.db.models.functions import TruncDate
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django_filters import FilterSet
 
 if TYPE_CHECKING:
@@ -15,6 +19,7 @@ else:
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import filters as rest_filters
 from rest_framework import mixins, parsers, viewsets
 from rest_framework.pagination import BasePagination
 from rest_framework.parsers import BaseParser
@@ -24,7 +29,7 @@ from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 from rest_framework.views import APIView
 
-from .filters import ProductFilter
+from .filters import ProductFilter, ShortCircuitFilterBackend
 from .models import Category, Order, OrderItem, Product
 from .permissions import IsSeller, IsSellerOrReadOnly, is_seller
 from .serializers import (
@@ -73,7 +78,13 @@ class ProductViewSet(viewsets.ModelViewSet):
         parsers.MultiPartParser,
     ]
 
-    # Filtering & ordering (as required by the task)
+    # Filtering & ordering (as required by the task). The first backend skips
+    # filterset/form construction entirely on unfiltered list requests.
+    filter_backends = [
+        ShortCircuitFilterBackend,
+        rest_filters.SearchFilter,
+        rest_filters.OrderingFilter,
+    ]
     filterset_class: type[FilterSet] = ProductFilter
     ordering_fields: list[str] = ["name", "price", "category__name"]  # name, category, price
     ordering: list[str] = ["name"]  # default ordering
@@ -93,14 +104,21 @@ class OrderViewSet(
     - Sellers (staff) can see all orders.
     """
 
-    queryset = Order.objects.select_related("customer").prefetch_related("items__product").all()
+    queryset = Order.objects.all()
     permission_classes: list[type[BasePermission]] = [IsAuthenticated]
     parser_classes: list[type[BaseParser]] = [parsers.JSONParser]
 
     def get_queryset(self) -> DJQuerySet[Order, Order]:
-        qs = cast(DJQuerySet[Order, Order], super().get_queryset())
+        # Eager loading lives with the serializer that needs it, so the
+        # prefetch list can't drift from the fields actually rendered.
+        # (String cast target: DJQuerySet aliases Any at runtime, and
+        # subscripting Any raises TypeError when evaluated.)
+        qs = cast(
+            "DJQuerySet[Order, Order]",
+            OrderDetailSerializer.setup_eager_loading(super().get_queryset()),
+        )
         user = self.request.user
-        if is_seller(user):
+        if is_seller(user, self.request):
             return qs
         # IsAuthenticated guarantees authenticated at runtime; assert narrows for mypy
         assert user.is_authenticated
@@ -162,24 +180,41 @@ class TopProductsStatsView(APIView):
         date_to = params.validated_data["date_to"]
         limit = params.validated_data["limit"]
 
-        # Aggregate total units by product across the date range (inclusive)
-        rows = list(
-            OrderItem.objects.annotate(created_date=TruncDate("order__created_at"))
-            .filter(created_date__range=(date_from, date_to))
-            .values("product", "product__name")
-            .annotate(units_ordered=Sum("quantity"))
-            .order_by("-units_ordered", "product")[:limit]
+        # The group-by over all order items is the most expensive query in
+        # the API, and dashboards poll it with identical params. A short TTL
+        # absorbs the polling; slight staleness is fine for a stats board.
+        # (Pattern-based invalidation on new orders isn't available on the
+        # stdlib Redis/locmem backends, hence TTL-only.)
+        cache_key = f"top-products:{date_from}:{date_to}:{limit}"
+        timeout = getattr(settings, "STATS_CACHE_SECONDS", 60)
+        data = cast(
+            "list[dict[str, Any]]",
+            cache.get_or_set(
+                cache_key, lambda: self._top_products(date_from, date_to, limit), timeout
+            ),
         )
 
-        # Normalize to a strictly-typed payload for the serializer
-        data: list[dict[str, Any]] = [
-            {
-                "product_id": int(r["product"]),
-                "product_name": str(r["product__name"]),
-                "units_ordered": int(r["units_ordered"] or 0),
-            }
-            for r in rows
-        ]
-
-        serializer = TopProductStatsSerializer(data, many=True)  # instance, nie data=
-        return Response(serializer.data)
+        # The rows are already serializer-shaped, JSON-safe dicts (aliased in
+        # SQL); re-running them through TopProductStatsSerializer would only
+        # burn CPU per field. The serializer still describes the response for
+        # the OpenAPI schema via @extend_schema above.
+        return Response(data)
+
+    @staticmethod
+    def _top_products(date_from: Any, date_to: Any, limit: int) -> list[dict[str, Any]]:
+        """Run the aggregation and normalize rows to plain, cacheable dicts."""
+        # Half-open datetime range in the current timezone: unlike the old
+        # TruncDate annotation, a plain comparison on order__created_at is
+        # sargable, so the created_at index narrows the scan.
+        tz = timezone.get_current_timezone()
+        start = datetime.combine(date_from, time.min, tzinfo=tz)
+        end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=tz)
+        # Columns are aliased in SQL to the serializer's field names, so the
+        # rows feed TopProductStatsSerializer as-is — no per-row dict rebuild
+        # or int() casts in Python (the DB already returns integers here).
+        return list(
+            OrderItem.objects.filter(order__created_at__gte=start, order__created_at__lt=end)
+            .values("product_id", product_name=F("product__name"))
+            .annotate(units_ordered=Coalesce(Sum("quantity"), 0))
+            .order_by("-units_ordered", "product_id")[:limit]
+        )